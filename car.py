@@ -3,14 +3,19 @@ Car Class Module
 Demonstrates creating a class in a module
 """
 
+from mypackage.utils.counters import get_counter
+
+# Estimated electric range per kWh of battery
+RANGE_PER_KWH = 4  # miles per kWh
+
 
 class Car:
     """
     A simple Car class to demonstrate OOP in modules
     """
 
-    # Class variable (shared by all instances)
-    total_cars = 0
+    # Class variable (shared by all instances), a thread-safe counter
+    total_cars = get_counter("Car.total_cars")
 
     def __init__(self, brand, model, year):
         """Initialize a new Car"""
@@ -18,7 +23,7 @@ class Car:
         self.model = model
         self.year = year
         self.odometer = 0
-        Car.total_cars += 1
+        Car.total_cars.increment()
 
     def get_info(self):
         """Return formatted car information"""
@@ -48,7 +53,7 @@ class Car:
     @classmethod
     def get_total_cars(cls):
         """Get total number of cars created"""
-        return cls.total_cars
+        return cls.total_cars.get_value()
 
 
 class ElectricCar(Car):
@@ -69,8 +74,7 @@ class ElectricCar(Car):
 
     def get_range(self):
         """Estimate range based on battery"""
-        range_per_kwh = 4  # miles per kWh
-        return self.battery_size * range_per_kwh
+        return self.battery_size * RANGE_PER_KWH
 
     def get_info(self):
         """Override to include battery info"""
@@ -3,6 +3,19 @@
 Object-Oriented Programming (OOP) in Python
 """
 
+from mypackage.models import interest, ledger, payments
+from mypackage.models.checkout import checkout_batch
+from mypackage.utils.calculator import _load_numpy
+from mypackage.utils.geometry import (
+    CIRCLE,
+    RECTANGLE,
+    TRIANGLE,
+    ShapeBatch,
+    dimension,
+    memoized,
+)
+from mypackage.utils.counters import get_counter
+
 print("=" * 90)
 print("🎯 PYTHON CLASSES & OBJECTS - COMPLETE TUTORIAL")
 print("=" * 90)
@@ -92,7 +105,8 @@ class Employee:
 
     # Class variable (shared by ALL instances)
     company_name = "TechCorp"
-    employee_count = 0
+    # Shared counter; safe to increment from many threads at once
+    employee_count = get_counter("Employee.employee_count")
 
     def __init__(self, name, position, salary):
         """Initialize instance variables"""
@@ -100,7 +114,7 @@ class Employee:
         self.name = name
         self.position = position
         self.salary = salary
-        Employee.employee_count += 1
+        Employee.employee_count.increment()
 
     def get_details(self):
         """Return employee details"""
@@ -111,6 +125,11 @@ class Employee:
         self.salary += amount
         return f"{self.name}'s new salary: ${self.salary:,.2f}"
 
+    @classmethod
+    def get_employee_count(cls):
+        """Get total number of employees created"""
+        return cls.employee_count.get_value()
+
 
 # Create employees
 emp1 = Employee("Alice Johnson", "Software Engineer", 85000)
@@ -124,7 +143,7 @@ print(emp3.get_details())
 print()
 
 print(f"💼 Company: {Employee.company_name}")
-print(f"👥 Total Employees: {Employee.employee_count}")
+print(f"👥 Total Employees: {Employee.get_employee_count()}")
 print()
 
 print(emp1.give_raise(5000))
@@ -150,21 +169,22 @@ class BankAccount:
 
     # Class variable
     interest_rate = 0.03  # 3%
-    total_accounts = 0
+    total_accounts = get_counter("BankAccount.total_accounts")
 
     def __init__(self, owner, balance=0):
         """Initialize account"""
         self.owner = owner
         self.balance = balance
-        self.transactions = []
-        BankAccount.total_accounts += 1
+        # Compact history; reads back as "Deposit: +$12.00" strings
+        self.transactions = ledger.Ledger(opening_balance=balance)
+        BankAccount.total_accounts.increment()
 
     # Instance method (operates on instance data)
     def deposit(self, amount):
         """Deposit money"""
         if amount > 0:
             self.balance += amount
-            self.transactions.append(f"Deposit: +${amount:.2f}")
+            self.transactions.record(ledger.DEPOSIT, amount)
             return f"Deposited ${amount:.2f}. New balance: ${self.balance:.2f}"
         return "Invalid amount"
 
@@ -174,7 +194,7 @@ class BankAccount:
             return "Insufficient funds!"
         if amount > 0:
             self.balance -= amount
-            self.transactions.append(f"Withdrawal: -${amount:.2f}")
+            self.transactions.record(ledger.WITHDRAWAL, amount)
             return f"Withdrew ${amount:.2f}. New balance: ${self.balance:.2f}"
         return "Invalid amount"
 
@@ -189,10 +209,16 @@ class BankAccount:
         cls.interest_rate = new_rate
         return f"Interest rate updated to {new_rate * 100}%"
 
+    @classmethod
+    def accrue_interest(cls, accounts, periods_per_year=12):
+        """Credit one period of interest at the class rate to every account"""
+        total = interest.accrue_accounts(accounts, cls.interest_rate, periods_per_year)
+        return f"Credited ${total:.2f} interest to {len(accounts)} accounts"
+
     @classmethod
     def get_total_accounts(cls):
         """Get total number of accounts"""
-        return cls.total_accounts
+        return cls.total_accounts.get_value()
 
     # Static method (doesn't use instance or class data)
     @staticmethod
@@ -217,6 +243,8 @@ print()
 
 # Using class method
 print(BankAccount.set_interest_rate(0.04))
+print(BankAccount.accrue_interest([account1, account2]))
+print(account1.get_balance())
 print(f"Total accounts created: {BankAccount.get_total_accounts()}")
 print()
 
@@ -499,23 +527,30 @@ class Customer:
         result += f"  Total: ${total:.2f}"
         return result
 
+    def get_cart_lines(self):
+        """Return the cart as (product, quantity) pairs"""
+        return [(item["product"], item["quantity"]) for item in self.cart]
+
     def checkout(self):
-        """Process checkout"""
+        """Process checkout: every line goes through, or none does"""
         if not self.cart:
             return "Cart is empty!"
 
-        total = 0
-        for item in self.cart:
-            product = item["product"]
-            qty = item["quantity"]
-            if product.reduce_stock(qty):
-                total += product.price * qty
-            else:
-                return f"❌ Checkout failed: {product.name} out of stock"
-
-        self.cart = []
+        total = sum(product.price * qty for product, qty in self.get_cart_lines())
+        completed, rejected = Customer.checkout_many([self])
+        if rejected:
+            _, product = rejected[0]
+            return f"❌ Checkout failed: {product.name} out of stock"
         return f"✅ Checkout successful! Total: ${total:.2f}"
 
+    @staticmethod
+    def checkout_many(customers):
+        """Check out a queue of customers in one batch, touching each product once"""
+        completed, rejected = checkout_batch(customers, Customer.get_cart_lines)
+        for customer in completed:
+            customer.cart = []
+        return completed, rejected
+
 
 # Using the e-commerce system
 print("🛍️ E-Commerce System Demo:")
@@ -551,6 +586,13 @@ print("💳 Checkout:")
 print(customer.checkout())
 print()
 
+# A cart that can't be filled in full changes nothing
+print(customer.add_to_cart(laptop, 5))
+print(customer.add_to_cart(mouse, 1))
+laptop.stock = 4  # someone else bought some laptops meanwhile
+print(customer.checkout())
+print()
+
 # Check updated stock
 print("📦 Updated Stock:")
 print(f"1. {laptop}")
@@ -567,6 +609,8 @@ print("9️⃣ INTERFACES - Abstract Base Classes (ABC)")
 print("=" * 90)
 print()
 
+import asyncio
+import math
 from abc import ABC, abstractmethod
 
 
@@ -587,6 +631,10 @@ class PaymentMethod(ABC):
         """Concrete method (optional to override)"""
         return f"Receipt: ${amount:.2f} processed"
 
+    async def process_payment_async(self, amount, gateway):
+        """Async variant: charge through a gateway, return a PaymentResult"""
+        return await payments.charge(self, amount, gateway)
+
 
 class CreditCard(PaymentMethod):
     """Credit card payment implementation"""
@@ -654,6 +702,15 @@ def process_order(payment_method, amount):
         print(payment_method.get_receipt(amount))
 
 
+async def process_order_async(payment_method, amount, gateway):
+    """Async process_order: checks the structured result instead of the text"""
+    result = await payment_method.process_payment_async(amount, gateway)
+    print(result.message)
+    if result.ok:
+        print(payment_method.get_receipt(amount))
+    return result
+
+
 # Using interfaces
 print("💳 Payment Methods Example:")
 print()
@@ -676,6 +733,16 @@ print("3. Cryptocurrency Payment:")
 process_order(crypto, 299.99)
 print()
 
+# The same payments, concurrently through a (stub) gateway
+print("4. Async Payments:")
+gateway = payments.StubGateway(latency=0.01, seed=1)
+asyncio.run(process_order_async(credit_card, 19.99, gateway))
+print("   ", end="")
+payments.run_payment_benchmark(
+    [credit_card, paypal, crypto], 300, gateway, limits={"Cryptocurrency": 4}
+)
+print()
+
 print("🔑 Interface Key Points:")
 print("  • ABC = Abstract Base Class (interface)")
 print("  • @abstractmethod = Must be implemented by child classes")
@@ -715,21 +782,28 @@ class Shape(ABC):
         """Calculate perimeter"""
         pass
 
+    @memoized
     def describe(self):
         """Describe the shape"""
         return f"{self.__class__.__name__}: Area={self.area():.2f}, Perimeter={self.perimeter():.2f}"
 
 
+# Results are memoized per shape and dropped whenever a dimension changes
 class Rectangle(Shape):
     """Rectangle implementation"""
 
+    width = dimension("width")
+    height = dimension("height")
+
     def __init__(self, width, height):
         self.width = width
         self.height = height
 
+    @memoized
     def area(self):
         return self.width * self.height
 
+    @memoized
     def perimeter(self):
         return 2 * (self.width + self.height)
 
@@ -737,33 +811,49 @@ class Rectangle(Shape):
 class Circle(Shape):
     """Circle implementation"""
 
+    radius = dimension("radius")
+
     def __init__(self, radius):
         self.radius = radius
 
+    @memoized
     def area(self):
-        return 3.14159 * self.radius**2
+        return math.pi * self.radius * self.radius
 
+    @memoized
     def perimeter(self):
-        return 2 * 3.14159 * self.radius
+        return 2 * math.pi * self.radius
 
 
 class Triangle(Shape):
     """Triangle implementation"""
 
+    a = dimension("a")
+    b = dimension("b")
+    c = dimension("c")
+
     def __init__(self, a, b, c):
         self.a = a
         self.b = b
         self.c = c
 
+    @memoized
     def area(self):
-        # Heron's formula
+        # Heron's formula; sides that can't form a triangle give area 0,
+        # the same as ShapeBatch
         s = (self.a + self.b + self.c) / 2
-        return (s * (s - self.a) * (s - self.b) * (s - self.c)) ** 0.5
+        return math.sqrt(max(s * (s - self.a) * (s - self.b) * (s - self.c), 0.0))
 
+    @memoized
     def perimeter(self):
         return self.a + self.b + self.c
 
 
+# Let ShapeBatch compute these types a whole column at a time
+ShapeBatch.register(Rectangle, RECTANGLE)
+ShapeBatch.register(Circle, CIRCLE)
+ShapeBatch.register(Triangle, TRIANGLE)
+
 # Polymorphism in action
 print("📐 Shapes Example (Polymorphism):")
 print()
@@ -774,13 +864,22 @@ shapes = [Rectangle(5, 10), Circle(7), Triangle(3, 4, 5)]
 for shape in shapes:
     print(f"  {shape.describe()}")
 
+# Changing a dimension recomputes on the next call
+shapes[1].radius = 1
+print(f"  After resizing: {shapes[1].describe()}")
+shapes[1].radius = 7
+
 print()
 
 
 # Calculate total area (works with any shape!)
 def calculate_total_area(shape_list):
     """Calculate total area of all shapes"""
-    return sum(shape.area() for shape in shape_list)
+    if _load_numpy() is None:
+        return sum(shape.area() for shape in shape_list)
+    # With NumPy, each registered shape type is computed as one batch;
+    # other Shape types still use their own area()
+    return ShapeBatch(shape_list).get_total_area()
 
 
 total = calculate_total_area(shapes)
@@ -0,0 +1,206 @@
+"""
+EV Simulator Module
+Event-driven simulation of trips and charging for many ElectricCars
+
+Each car alternates between driving trips and charging. Events are kept
+in a priority queue ordered by simulated time, so the simulation jumps
+from one event to the next instead of ticking through every minute,
+and thousands of cars can be simulated for a month in seconds.
+"""
+
+import heapq
+import math
+import random
+import time
+
+from car import RANGE_PER_KWH, ElectricCar
+
+# Event kinds
+TRIP_START = 0
+TRIP_END = 1
+CHARGE_END = 2
+
+
+class ChargeCurve:
+    """
+    Charging power as a function of battery level
+
+    Full power up to taper_start percent, then power falls linearly
+    towards zero at 100%, but never below min_fraction of full power.
+    """
+
+    def __init__(self, power_kw=11.0, taper_start=80.0, min_fraction=0.1):
+        """Initialize a charge curve"""
+        if not 0 < min_fraction <= 1:
+            raise ValueError("min_fraction must be between 0 and 1")
+        self.power_kw = power_kw
+        self.taper_start = taper_start
+        self.min_fraction = min_fraction
+        # Level where the linear taper reaches the power floor
+        self._floor_start = 100 - min_fraction * (100 - taper_start)
+
+    def get_power(self, level):
+        """Return charging power in kW at a battery level (percent)"""
+        if level < self.taper_start:
+            return self.power_kw
+        taper = (100 - level) / (100 - self.taper_start)
+        return self.power_kw * max(taper, self.min_fraction)
+
+    def get_charge_hours(self, battery_size, from_level, to_level=100.0):
+        """Return hours needed to charge from one level (percent) to another"""
+        if to_level <= from_level:
+            return 0.0
+        kwh_per_percent = battery_size / 100
+        hours = 0.0
+
+        # Full-power segment
+        low, high = from_level, min(to_level, self.taper_start)
+        if high > low:
+            hours += (high - low) * kwh_per_percent / self.power_kw
+
+        # Linear taper: power = P * (100 - L) / (100 - taper_start)
+        low, high = max(from_level, self.taper_start), min(to_level, self._floor_start)
+        if high > low:
+            hours += (
+                kwh_per_percent
+                * (100 - self.taper_start)
+                / self.power_kw
+                * math.log((100 - low) / (100 - high))
+            )
+
+        # Power floor
+        low, high = max(from_level, self._floor_start), to_level
+        if high > low:
+            floor_power = self.power_kw * self.min_fraction
+            hours += (high - low) * kwh_per_percent / floor_power
+        return hours
+
+
+class EVSimulation:
+    """
+    Simulates trips and charging for a group of ElectricCars
+
+    Battery levels and odometers are kept in lists while the simulation
+    runs and written back to the cars by run().
+    """
+
+    def __init__(
+        self,
+        cars,
+        charge_curve=None,
+        miles_per_kwh=RANGE_PER_KWH,
+        trips_per_day=3.0,
+        mean_trip_miles=15.0,
+        average_speed=30.0,
+        charge_below=20.0,
+        seed=None,
+    ):
+        """Set up a simulation over the given ElectricCars"""
+        self.cars = list(cars)
+        for car in self.cars:
+            if not isinstance(car, ElectricCar):
+                raise TypeError(f"{car!r} is not an ElectricCar")
+        self.charge_curve = charge_curve or ChargeCurve()
+        self.miles_per_kwh = miles_per_kwh
+        self.trips_per_day = trips_per_day
+        self.mean_trip_miles = mean_trip_miles
+        self.average_speed = average_speed
+        self.charge_below = charge_below
+        self._random = random.Random(seed)
+
+    def _next_trip_delay(self):
+        """Hours until a car's next trip"""
+        return self._random.expovariate(self.trips_per_day / 24)
+
+    def run(self, days=30):
+        """Simulate the given number of days and return summary statistics"""
+        end = days * 24.0
+        sizes = [car.battery_size for car in self.cars]
+        levels = [float(car.battery_level) for car in self.cars]
+        odometers = [car.odometer for car in self.cars]
+        trip_miles = [0.0] * len(self.cars)
+
+        stats = {
+            "events": 0,
+            "trips": 0,
+            "deferred_trips": 0,
+            "charges": 0,
+            "miles": 0.0,
+            "kwh_used": 0.0,
+            "kwh_charged": 0.0,
+            "charging_hours": 0.0,
+        }
+
+        queue = [(self._next_trip_delay(), i, TRIP_START) for i in range(len(sizes))]
+        heapq.heapify(queue)
+
+        def start_charging(now, i):
+            hours = self.charge_curve.get_charge_hours(sizes[i], levels[i])
+            heapq.heappush(queue, (now + hours, i, CHARGE_END))
+            stats["charges"] += 1
+            stats["charging_hours"] += hours
+
+        while queue and queue[0][0] < end:
+            now, i, kind = heapq.heappop(queue)
+            stats["events"] += 1
+
+            if kind == TRIP_START:
+                miles = self._random.expovariate(1 / self.mean_trip_miles)
+                kwh = miles / self.miles_per_kwh
+                percent = kwh / sizes[i] * 100
+                if percent > levels[i]:
+                    # Not enough charge: charge first, take a new trip later
+                    stats["deferred_trips"] += 1
+                    start_charging(now, i)
+                    continue
+                levels[i] -= percent
+                trip_miles[i] = miles
+                stats["trips"] += 1
+                stats["kwh_used"] += kwh
+                heapq.heappush(queue, (now + miles / self.average_speed, i, TRIP_END))
+
+            elif kind == TRIP_END:
+                odometers[i] += trip_miles[i]
+                stats["miles"] += trip_miles[i]
+                if levels[i] < self.charge_below:
+                    start_charging(now, i)
+                else:
+                    next_trip = now + self._next_trip_delay()
+                    heapq.heappush(queue, (next_trip, i, TRIP_START))
+
+            else:  # CHARGE_END
+                stats["kwh_charged"] += (100 - levels[i]) * sizes[i] / 100
+                levels[i] = 100.0
+                heapq.heappush(queue, (now + self._next_trip_delay(), i, TRIP_START))
+
+        for car, level, odometer in zip(self.cars, levels, odometers):
+            car.battery_level = level
+            car.odometer = odometer
+        return stats
+
+
+# Test code (runs only when executed directly)
+if __name__ == "__main__":
+    print("🔋 EV Simulator - Testing")
+    print()
+
+    curve = ChargeCurve(power_kw=11)
+    for level in (10, 50, 80, 90):
+        hours = curve.get_charge_hours(75, level)
+        print(f"  75 kWh from {level}% to 100%: {hours:.2f} h")
+    print()
+
+    car_count = 5_000
+    cars = [
+        ElectricCar("Tesla", "Model 3", 2023, random.choice((60, 75, 82)))
+        for _ in range(car_count)
+    ]
+    simulation = EVSimulation(cars, curve, seed=42)
+    start = time.perf_counter()
+    stats = simulation.run(days=30)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated 30 days for {car_count:,} cars in {elapsed:.2f} s")
+    for key, value in stats.items():
+        shown = f"{value:,.1f}" if isinstance(value, float) else f"{value:,}"
+        print(f"  {key}: {shown}")
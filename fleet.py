@@ -0,0 +1,178 @@
+"""
+Fleet Module
+Stores many Car and ElectricCar records in typed columns
+"""
+
+import math
+import sys
+from array import array
+
+from car import RANGE_PER_KWH, Car, ElectricCar
+from mypackage.utils.calculator import add_many
+
+
+def _column_property(column):
+    """Build a property that reads/writes one fleet column at the view's row"""
+
+    def getter(self):
+        return getattr(self._fleet, column)[self._index]
+
+    def setter(self, value):
+        getattr(self._fleet, column)[self._index] = value
+
+    return property(getter, setter)
+
+
+def _number_column_property(column):
+    """Like _column_property for a float column, but whole numbers read back as ints"""
+
+    def getter(self):
+        value = getattr(self._fleet, column)[self._index]
+        return int(value) if value.is_integer() else value
+
+    def setter(self, value):
+        getattr(self._fleet, column)[self._index] = value
+
+    return property(getter, setter)
+
+
+class _FleetView:
+    """
+    Column-backed attributes shared by the fleet's Car views
+
+    Views are made on demand; two views of the same row compare and hash
+    equal.
+    """
+
+    brand = _column_property("_brands")
+    model = _column_property("_models")
+    year = _column_property("_years")
+    odometer = _number_column_property("_odometers")
+    battery_size = _number_column_property("_battery_sizes")
+    battery_level = _number_column_property("_battery_levels")
+
+    def __init__(self, fleet, index):
+        """Point the view at a fleet row (does not count as a new car)"""
+        self._fleet = fleet
+        self._index = index
+
+    def __eq__(self, other):
+        if not isinstance(other, _FleetView):
+            return NotImplemented
+        return self._fleet is other._fleet and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._fleet), self._index))
+
+
+class FleetCar(_FleetView, Car):
+    """A Car view onto one row of a Fleet"""
+
+
+class FleetElectricCar(_FleetView, ElectricCar):
+    """An ElectricCar view onto one row of a Fleet"""
+
+
+class Fleet:
+    """
+    A column store for cars
+
+    Brands and models are interned strings, years, odometers and battery
+    fields are typed arrays. The float columns read back whole numbers as
+    ints, as a Car would hold them. Gas cars have a battery size of 0.
+    """
+
+    def __init__(self, cars=()):
+        """Create a fleet, optionally filled from existing cars"""
+        self._brands = []
+        self._models = []
+        self._years = array("i")
+        self._odometers = array("d")
+        self._battery_sizes = array("d")
+        self._battery_levels = array("d")
+        self._electric = array("b")
+        for car in cars:
+            self.add_car(car)
+
+    def add(self, brand, model, year, battery_size=None, odometer=0):
+        """Append a car row (electric if battery_size is given) and return its view"""
+        self._brands.append(sys.intern(brand))
+        self._models.append(sys.intern(model))
+        self._years.append(year)
+        self._odometers.append(odometer)
+        self._battery_sizes.append(battery_size or 0)
+        self._battery_levels.append(100 if battery_size is not None else 0)
+        self._electric.append(battery_size is not None)
+        return self[len(self) - 1]
+
+    def add_car(self, car):
+        """Copy an existing Car or ElectricCar into the fleet"""
+        battery_size = car.battery_size if isinstance(car, ElectricCar) else None
+        view = self.add(car.brand, car.model, car.year, battery_size, car.odometer)
+        if battery_size is not None:
+            view.battery_level = car.battery_level
+        return view
+
+    def drive(self, miles):
+        """Add miles to every odometer: one number for all cars, or one per car"""
+        self._odometers = add_many(self._odometers, miles)
+
+    def get_total_miles(self):
+        """Return the sum of all odometers"""
+        return math.fsum(self._odometers)
+
+    def get_average_age(self, current_year=2025):
+        """Return the average Car.get_age over the fleet"""
+        if not self._years:
+            return 0
+        return current_year - math.fsum(self._years) / len(self._years)
+
+    def get_total_range(self):
+        """Return the sum of ElectricCar.get_range over the electric cars"""
+        return math.fsum(self._battery_sizes) * RANGE_PER_KWH
+
+    def get_electric_count(self):
+        """Return how many cars are electric"""
+        return sum(self._electric)
+
+    def __len__(self):
+        return len(self._brands)
+
+    def __getitem__(self, index):
+        """Return a Car or ElectricCar view onto a row"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("fleet index out of range")
+        view_class = FleetElectricCar if self._electric[index] else FleetCar
+        return view_class(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"Fleet({len(self)} cars, {self.get_electric_count()} electric)"
+
+
+# Test code (runs only when executed directly)
+if __name__ == "__main__":
+    print("🚙 Fleet Module - Testing")
+    print()
+
+    fleet = Fleet(
+        [Car("Toyota", "Camry", 2022), ElectricCar("Tesla", "Model 3", 2023, 75)]
+    )
+    fleet.add("Nissan", "Leaf", 2021, battery_size=62)
+    print(fleet)
+
+    fleet.drive(100)
+    fleet.drive([10, 20, 30])
+    for car in fleet:
+        print(f"  {car.get_info()}: {car.odometer} miles")
+
+    print(f"Average age: {fleet.get_average_age():.2f} years")
+    print(f"Total range: {fleet.get_total_range():.0f} miles")
+    print(f"Total miles: {fleet.get_total_miles():.0f}")
+    print(fleet[1].charge())
+    assert fleet[1] == fleet[1] and len({fleet[1], fleet[1], fleet[2]}) == 2
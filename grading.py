@@ -0,0 +1,199 @@
+"""
+Grading Module
+Bulk letter grades for large classes of students
+
+Scores come in as columns: one sequence per assessment, each holding
+every student's score for it. Averages are built column by column with
+the calculator's batch functions (NumPy-backed when installed), then
+mapped to letters through a GradeScale. Big classes can be split into
+shards and graded across a process pool.
+"""
+
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from mypackage.utils.calculator import _load_numpy, add_many, divide_many
+
+# (minimum average, letter), the original if/elif grade ladder
+DEFAULT_CUTOFFS = ((90, "A"), (80, "B"), (70, "C"), (60, "D"))
+DEFAULT_SHARD_SIZE = 250_000
+
+
+class GradeScale:
+    """
+    Maps averages to letter grades
+
+    An average gets the letter of the highest cutoff it reaches, or
+    lowest if it reaches none (NaN reaches none). When every cutoff is a
+    whole number, non-negative averages are looked up in a table by
+    their integer part instead of searched; averages past the end of the
+    table get the top letter.
+    """
+
+    def __init__(self, cutoffs=DEFAULT_CUTOFFS, lowest="F"):
+        """Initialize a scale from (minimum average, letter) pairs"""
+        ordered = sorted(cutoffs)
+        self.cutoffs = tuple(ordered)
+        self.lowest = lowest
+        self._thresholds = [threshold for threshold, _ in ordered]
+        self._letters = [lowest] + [letter for _, letter in ordered]
+
+        self._table = None
+        if all(float(t).is_integer() and t >= 0 for t in self._thresholds):
+            top = int(self._thresholds[-1]) if ordered else 0
+            self._table = [self._search(score) for score in range(top + 1)]
+
+    def _search(self, average):
+        """Binary search for the letter of an average"""
+        return self._letters[bisect_right(self._thresholds, average)]
+
+    def grade(self, average):
+        """Return the letter grade for one average"""
+        table = self._table
+        if table is not None and average >= 0:
+            return table[int(average)] if average < len(table) else table[-1]
+        if average != average:  # NaN
+            return self.lowest
+        return self._search(average)
+
+    def grade_many(self, averages):
+        """Return a list of letter grades, one per average"""
+        table, grade = self._table, self.grade
+        if table is None:
+            return list(map(grade, averages))
+        size = len(table)
+        # Averages off the table (negative, past the end, NaN) go through grade()
+        return [table[int(x)] if 0 <= x < size else grade(x) for x in averages]
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"GradeScale({self.cutoffs!r}, lowest={self.lowest!r})"
+
+
+DEFAULT_SCALE = GradeScale()
+
+
+def compute_averages(columns):
+    """Return each student's average (an array('d') when the columns are arrays)"""
+    columns = list(columns)
+    if not columns:
+        raise ValueError("Need at least one score column")
+    totals = columns[0]
+    for column in columns[1:]:
+        totals = add_many(totals, column)
+    # Divide (not multiply by 1/n) so whole-number averages come out exact
+    return divide_many(totals, len(columns))
+
+
+def _grade_shard(task):
+    """Worker: grade one shard of rows, return (averages, grades)"""
+    columns, cutoffs, lowest = task
+    scale = GradeScale(cutoffs, lowest)
+    averages = compute_averages(columns)
+    return averages, scale.grade_many(averages)
+
+
+def _concatenate(parts):
+    """Join shard results of one type (lists, arrays or NumPy arrays)"""
+    np = _load_numpy()
+    if np is not None and isinstance(parts[0], np.ndarray):
+        return np.concatenate(parts)
+    joined = parts[0]
+    for part in parts[1:]:
+        joined.extend(part)
+    return joined
+
+
+def grade_students(columns, scale=None, workers=0, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Grade every student in a columnar score matrix
+
+    columns holds one sequence of scores per assessment (arrays are the
+    cheapest to send to worker processes). With workers=0 everything runs
+    in this process; otherwise rows are split into shards of shard_size
+    and graded across a pool of that many processes (None for one per
+    CPU). Returns (averages, grades) in student order. Both ways raise
+    ValueError when there are no columns.
+    """
+    scale = scale or DEFAULT_SCALE
+    columns = list(columns)
+    if workers == 0:
+        averages = compute_averages(columns)
+        return averages, scale.grade_many(averages)
+
+    count = len(columns[0]) if columns else 0
+    tasks = [
+        (
+            [column[start : start + shard_size] for column in columns],
+            scale.cutoffs,
+            scale.lowest,
+        )
+        for start in range(0, count, shard_size)
+    ]
+    parts = []
+    grades = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard_averages, shard_grades in pool.map(_grade_shard, tasks):
+            parts.append(shard_averages)
+            grades.extend(shard_grades)
+    if not parts:
+        # No shards: no columns (raises, like workers=0) or no rows
+        return compute_averages(columns), grades
+    return _concatenate(parts), grades
+
+
+# Test code (runs only when executed directly)
+if __name__ == "__main__":
+    import os
+    import random
+    from array import array
+
+    import math_utils
+
+    print(f"🎓 Grading Module - Benchmark ({os.cpu_count()} CPUs)")
+
+    def ladder(average):
+        """The original if/elif ladder"""
+        if average >= 90:
+            return "A"
+        elif average >= 80:
+            return "B"
+        elif average >= 70:
+            return "C"
+        elif average >= 60:
+            return "D"
+        return "F"
+
+    student_count = 1_000_000
+    assessments = 4
+    rng = random.Random(7)
+    columns = [
+        array("d", (rng.randint(40, 100) for _ in range(student_count)))
+        for _ in range(assessments)
+    ]
+
+    start = time.perf_counter()
+    rows = list(zip(*columns))
+    expected = [ladder(math_utils.average(scores)) for scores in rows]
+    per_student = time.perf_counter() - start
+    print(f"  per-student average + ladder: {per_student:.2f} s")
+
+    for workers in (0, 4):
+        start = time.perf_counter()
+        averages, grades = grade_students(columns, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert grades == expected
+        print(f"  grade_students(workers={workers}):  {elapsed:.2f} s")
+
+    plus_minus = GradeScale(
+        [(93, "A"), (90, "A-"), (87, "B+"), (83, "B"), (80, "B-"), (70, "C"), (60, "D")]
+    )
+    print(f"  {plus_minus}")
+    print(f"  91.5 -> {plus_minus.grade(91.5)}, 100 -> {plus_minus.grade(100)}")
+    assert plus_minus.grade_many([92.9, 59.99, 100]) == ["A-", "F", "A"]
+    assert GradeScale([(59.5, "Pass")]).grade_many([59.4, 59.5]) == ["F", "Pass"]
+    assert plus_minus.grade_many([float("nan"), 1e12, float("inf")]) == ["F", "A", "A"]
+    assert plus_minus.grade(float("nan")) == "F"
+    empty = [array("d"), array("d")]
+    assert grade_students(empty) == grade_students(empty, workers=2) == (array("d"), [])
@@ -0,0 +1,65 @@
+"""
+Import-Time Benchmark
+Checks that "import mypackage" stays cheap and silent
+
+Each measurement runs in a fresh interpreter so nothing is cached in
+sys.modules. The median cost of "import mypackage" is compared against
+the median cost of an empty interpreter start, and the script exits
+with status 1 if the difference is larger than the budget.
+
+Usage:
+    python import_benchmark.py [runs] [budget_ms]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_RUNS = 20
+DEFAULT_BUDGET_MS = 10.0
+
+
+def time_interpreter(code, runs=DEFAULT_RUNS):
+    """Return (median seconds, stdout of last run) for running code in a new interpreter"""
+    timings = []
+    output = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+        output = result.stdout
+    return statistics.median(timings), output
+
+
+def run_benchmark(runs=DEFAULT_RUNS, budget_ms=DEFAULT_BUDGET_MS):
+    """Compare import cost with the bare interpreter, return True if within budget"""
+    baseline, _ = time_interpreter("pass", runs)
+    package, output = time_interpreter("import mypackage", runs)
+    overhead_ms = (package - baseline) * 1000
+
+    print(f"Interpreter baseline: {baseline * 1000:.2f} ms")
+    print(f"import mypackage:     {package * 1000:.2f} ms")
+    print(f"Overhead:             {overhead_ms:.2f} ms (budget {budget_ms:.2f} ms)")
+
+    ok = True
+    if output:
+        print(f"❌ import printed to stdout: {output!r}")
+        ok = False
+    if overhead_ms > budget_ms:
+        print("❌ Import overhead is over budget")
+        ok = False
+    if ok:
+        print("✅ Import is silent and within budget")
+    return ok
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BUDGET_MS
+    sys.exit(0 if run_benchmark(runs, budget_ms) else 1)
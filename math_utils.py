@@ -3,6 +3,14 @@ Math Utilities Module
 Provides basic mathematical operations
 """
 
+import math
+from itertools import chain, islice
+
+import primes
+
+# How many values RunningStats buffers before folding them into its totals
+STATS_CHUNK_SIZE = 4096
+
 
 def add(a, b):
     """Add two numbers"""
@@ -32,10 +40,164 @@ def power(base, exponent):
 
 
 def average(numbers):
-    """Calculate average of a list of numbers"""
-    if not numbers:
+    """
+    Calculate average of numbers (any iterable, one pass)
+
+    Ints and floats go through RunningStats' exact sum; other numeric
+    types (Decimal, Fraction) are summed with their own arithmetic.
+    """
+    iterator = iter(numbers)
+    for first in iterator:
+        break
+    else:
         return 0
-    return sum(numbers) / len(numbers)
+    if not isinstance(first, (int, float)):
+        total, count = first, 1
+        for number in iterator:
+            total += number
+            count += 1
+        return total / count
+    return RunningStats(chain((first,), iterator)).get_mean()
+
+
+def _fsum(values):
+    """math.fsum, or a plain float sum when the total isn't finite"""
+    try:
+        return math.fsum(values)
+    except (OverflowError, ValueError):
+        # Overflow, or inf and -inf together: fsum refuses, sum gives inf/nan
+        return sum(values, 0.0)
+
+
+def _add_partial(partials, x):
+    """
+    Add x to a list of non-overlapping float partials (exact summation)
+
+    Returns 0.0, or the infinite sum if it overflowed (partials are
+    then cleared, since no finite total is left to track).
+    """
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        if math.isinf(hi):
+            partials.clear()
+            return hi
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+    return 0.0
+
+
+class RunningStats:
+    """
+    One-pass statistics over a stream of numbers
+
+    Tracks count, mean, variance, min and max without storing the
+    values. Values are converted to float and folded in chunks: each
+    chunk is summed with math.fsum and combined with the running totals
+    using the parallel form of Welford's algorithm, and the grand total
+    is kept as exact partial sums. Infinities, NaNs and overflow are
+    kept aside and make the total inf or nan, as sum() would. Two
+    RunningStats built on separate chunks (e.g. in worker processes)
+    can be combined with merge().
+    """
+
+    def __init__(self, values=()):
+        """Create an accumulator, optionally consuming values"""
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self._partials = []  # exact running sum, as in math.fsum
+        self._special = 0.0  # sum of the non-finite parts (inf, nan, overflow)
+        self._m2 = 0.0  # sum of squared deviations from the mean
+        self.update(values)
+
+    def add(self, value):
+        """Add a single value"""
+        value = float(value)
+        self._combine(1, value, 0.0, value, value)
+        self._add_total(value)
+
+    def update(self, values):
+        """Add every value from an iterable, one chunk at a time"""
+        iterator = iter(values)
+        while True:
+            chunk = list(map(float, islice(iterator, STATS_CHUNK_SIZE)))
+            if not chunk:
+                break
+            total = _fsum(chunk)
+            mean = total / len(chunk)
+            m2 = _fsum([(x - mean) * (x - mean) for x in chunk])
+            self._combine(len(chunk), total, m2, min(chunk), max(chunk))
+            self._add_total(total)
+            if math.isfinite(total):
+                # Keep what fsum rounded away so the grand total stays exact
+                chunk.append(-total)
+                self._add_total(math.fsum(chunk))
+
+    def merge(self, other):
+        """Fold another RunningStats into this one and return self"""
+        if other.count:
+            self._combine(
+                other.count, other.get_total(), other._m2, other.minimum, other.maximum
+            )
+            for partial in other._partials:
+                self._add_total(partial)
+            self._special += other._special
+        return self
+
+    def _add_total(self, x):
+        """Add x to the grand total (exactly, while it stays finite)"""
+        if math.isfinite(x):
+            x = _add_partial(self._partials, x)
+        self._special += x
+
+    def _combine(self, count, total, m2, minimum, maximum):
+        """Merge a group's count, mean and squared deviations (not its sum)"""
+        if self.count:
+            delta = total / count - self.get_mean()
+            self._m2 += m2 + delta * delta * self.count * count / (self.count + count)
+            self.minimum = min(self.minimum, minimum)
+            self.maximum = max(self.maximum, maximum)
+        else:
+            self._m2 = m2
+            self.minimum = minimum
+            self.maximum = maximum
+        self.count += count
+
+    def get_total(self):
+        """Return the correctly rounded sum of all values"""
+        if self._special:
+            return self._special
+        return _fsum(self._partials)
+
+    def get_mean(self):
+        """Return the mean (0 for no values)"""
+        if not self.count:
+            return 0
+        return self.get_total() / self.count
+
+    def get_variance(self, sample=False):
+        """Return the population variance, or the sample variance if sample=True"""
+        if self.count - sample <= 0:
+            return 0.0
+        return self._m2 / (self.count - sample)
+
+    def get_stdev(self, sample=False):
+        """Return the population (or sample) standard deviation"""
+        return math.sqrt(self.get_variance(sample))
+
+    def __repr__(self):
+        """Developer representation"""
+        return (
+            f"RunningStats(count={self.count}, mean={self.get_mean()}, "
+            f"variance={self.get_variance()})"
+        )
 
 
 def is_even(number):
@@ -44,13 +206,15 @@ def is_even(number):
 
 
 def is_prime(n):
-    """Check if a number is prime"""
-    if n < 2:
-        return False
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
+    """Check if a number is prime (sieve cache / Miller-Rabin, see primes.py)"""
+    if isinstance(n, int):
+        return primes.is_prime(n)
+    return primes.is_prime_trial(n)
+
+
+def primes_in_range(start, stop):
+    """Yield the primes p with start <= p < stop"""
+    return primes.primes_in_range(start, stop)
 
 
 # Module-level constants
@@ -71,6 +235,10 @@ if __name__ == "__main__":
     print(f"divide(20, 4) = {divide(20, 4)}")
     print(f"power(2, 3) = {power(2, 3)}")
     print(f"average([1, 2, 3, 4, 5]) = {average([1, 2, 3, 4, 5])}")
+    print(f"average(x / 10 for x in range(10)) = {average(x / 10 for x in range(10))}")
+    print(f"average([1e308, 1e308]) = {average([1e308, 1e308])}")
+    print(f"RunningStats(range(10)) = {RunningStats(range(10))}")
     print(f"is_even(4) = {is_even(4)}")
     print(f"is_prime(7) = {is_prime(7)}")
+    print(f"primes_in_range(10, 30) = {list(primes_in_range(10, 30))}")
     print(f"PI = {PI}")
@@ -0,0 +1,61 @@
+"""
+Memory Benchmark
+Reports bytes per instance for Person and Product, with and without __slots__
+
+The "before" numbers come from a dict-backed copy of each class: the
+same methods and class variables, but without __slots__, which is how
+the models were defined before they were slotted.
+
+Usage:
+    python memory_benchmark.py [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from mypackage.models.person import Person
+from mypackage.models.product import Product
+
+DEFAULT_COUNT = 1_000_000
+
+
+def dict_backed(cls):
+    """Return a copy of a slotted class that stores attributes in __dict__"""
+    skip = set(cls.__slots__) | {"__slots__", "__dict__", "__weakref__"}
+    namespace = {key: value for key, value in vars(cls).items() if key not in skip}
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def bytes_per_instance(factory, count):
+    """Allocate count objects with factory() and return traced bytes per object"""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory() for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Don't charge the list that holds the objects to the objects themselves
+    per_object = (current - sys.getsizeof(objects)) / count
+    del objects
+    return per_object
+
+
+def run_benchmark(count=DEFAULT_COUNT):
+    """Print a before/after table for both models"""
+    cases = [
+        ("Person", Person, lambda cls: cls("John", "Doe", 30, "john@example.com")),
+        ("Product", Product, lambda cls: cls("Laptop", 999.99, 50, "Electronics")),
+    ]
+
+    print(f"Bytes per instance ({count:,} objects)")
+    print(f"{'Model':<10}{'dict':>12}{'slots':>12}{'saved':>12}")
+    for name, cls, make in cases:
+        before_cls = dict_backed(cls)
+        before = bytes_per_instance(lambda: make(before_cls), count)
+        after = bytes_per_instance(lambda: make(cls), count)
+        print(f"{name:<10}{before:>12.1f}{after:>12.1f}{before - after:>12.1f}")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    run_benchmark(count)
@@ -4,6 +4,7 @@ This demonstrates how to import and use the modules we created
 """
 
 # Import our custom modules
+import grading
 import math_utils
 import string_utils
 from car import Car, ElectricCar
@@ -88,31 +89,16 @@ print("=" * 80)
 print()
 
 
-def calculate_grade(scores):
-    """Calculate letter grade based on average score"""
-    avg = math_utils.average(scores)
-
-    if avg >= 90:
-        return "A"
-    elif avg >= 80:
-        return "B"
-    elif avg >= 70:
-        return "C"
-    elif avg >= 60:
-        return "D"
-    else:
-        return "F"
-
-
 students = {
     "Alice": [95, 88, 92, 90],
     "Bob": [78, 82, 75, 80],
     "Charlie": [88, 85, 90, 87],
 }
 
-for name, scores in students.items():
-    avg = math_utils.average(scores)
-    grade = calculate_grade(scores)
+# Grade the whole class at once: one column of scores per assessment
+averages, grades = grading.grade_students(zip(*students.values()))
+
+for name, scores, avg, grade in zip(students, students.values(), averages, grades):
     print(f"{name}:")
     print(f"  Scores: {scores}")
     print(f"  Average: {avg:.2f}")
@@ -130,14 +116,18 @@ print()
 
 
 def analyze_text(text):
-    """Analyze text using string_utils functions"""
+    """Analyze text in one pass with string_utils.TextStats"""
+    stats = string_utils.TextStats.from_text(text)
     print(f"Original text: '{text}'")
-    print(f"Character count: {len(text)}")
-    print(f"Word count: {string_utils.count_words(text)}")
-    print(f"Vowel count: {string_utils.count_vowels(text)}")
-    print(f"Reversed: '{string_utils.reverse(text)}'")
-    print(f"Capitalized: '{string_utils.capitalize_words(text)}'")
-    print(f"Snake case: '{string_utils.to_snake_case(text)}'")
+    print(f"Character count: {stats.char_count}")
+    print(f"Word count: {stats.word_count}")
+    print(f"Vowel count: {stats.get_vowel_count()}")
+    most_common = stats.character_counts.most_common(1)
+    if most_common:
+        print(f"Most common character: '{most_common[0][0]}'")
+    print(f"Reversed: '{stats.get_reversed()}'")
+    print(f"Capitalized: '{stats.get_capitalized()}'")
+    print(f"Snake case: '{stats.get_snake_case()}'")
 
 
 sample_text = "data science is awesome"
@@ -4,31 +4,39 @@ Version: 1.0.0
 
 This package demonstrates proper Python package structure
 with subpackages, modules, and __init__.py files.
+
+Names listed in __all__ are loaded lazily: the submodule that defines
+them is only imported the first time the name is accessed, so a plain
+"import mypackage" stays cheap and prints nothing.
+Set MYPACKAGE_VERBOSE=1 to get the old "loaded successfully" banner.
 """
 
+import os
+
+from mypackage._lazy import attach
+
 # Package metadata
 __version__ = "1.0.0"
 __author__ = "Python Series"
 __email__ = "contact@pythonseries.com"
 
-# Import key functions/classes for easier access
-from mypackage.utils.calculator import add, subtract, multiply, divide
-from mypackage.utils.formatter import format_currency, format_date
-from mypackage.models.person import Person
-from mypackage.models.product import Product
+# Map each exported name to the submodule that defines it
+_LAZY_IMPORTS = {
+    "add": "mypackage.utils.calculator",
+    "subtract": "mypackage.utils.calculator",
+    "multiply": "mypackage.utils.calculator",
+    "divide": "mypackage.utils.calculator",
+    "format_currency": "mypackage.utils.formatter",
+    "format_date": "mypackage.utils.formatter",
+    "Person": "mypackage.models.person",
+    "Product": "mypackage.models.product",
+}
 
 # Define what gets imported with "from mypackage import *"
-__all__ = [
-    "add",
-    "subtract",
-    "multiply",
-    "divide",
-    "format_currency",
-    "format_date",
-    "Person",
-    "Product",
-    "__version__",
-]
-
-# Package initialization message
-print(f"📦 MyPackage v{__version__} loaded successfully!")
+__all__ = [*_LAZY_IMPORTS, "__version__"]
+
+__getattr__, __dir__ = attach(__name__, globals(), _LAZY_IMPORTS)
+
+# Package initialization message (opt-in only)
+if os.environ.get("MYPACKAGE_VERBOSE"):
+    print(f"📦 MyPackage v{__version__} loaded successfully!")
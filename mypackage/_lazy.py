@@ -0,0 +1,39 @@
+"""
+Lazy exports
+Shared PEP 562 hooks for the package __init__ modules
+
+Each __init__ keeps a table mapping exported names to the submodule
+that defines them; the submodule is only imported the first time one
+of its names is accessed. Any other name is tried as a submodule, so
+"import mypackage" followed by mypackage.utils.calculator works as it
+did when the __init__ modules imported everything eagerly.
+"""
+
+import importlib
+
+
+def attach(module_name, namespace, lazy_imports):
+    """Return (__getattr__, __dir__) for a module with the given lazy table"""
+
+    def __getattr__(name):
+        """Resolve an exported name on first access"""
+        source = lazy_imports.get(name)
+        if source is None:
+            submodule = f"{module_name}.{name}"
+            try:
+                # Importing a submodule also sets it as an attribute here
+                return importlib.import_module(submodule)
+            except ModuleNotFoundError as error:
+                if error.name != submodule:
+                    raise
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source), name)
+        # Cache it so later lookups skip __getattr__ entirely
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        """List lazy names alongside the ones already loaded"""
+        return sorted(set(namespace) | set(lazy_imports))
+
+    return __getattr__, __dir__
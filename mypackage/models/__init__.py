@@ -1,9 +1,23 @@
 """
 Models subpackage
 Contains data model classes
+
+Exports are loaded lazily, see mypackage/__init__.py.
 """
 
-from mypackage.models.person import Person
-from mypackage.models.product import Product
+from mypackage._lazy import attach
+
+_LAZY_IMPORTS = {
+    "Person": "mypackage.models.person",
+    "Product": "mypackage.models.product",
+    "ProductCatalog": "mypackage.models.catalog",
+    "Inventory": "mypackage.models.inventory",
+    "StockManager": "mypackage.models.stock",
+    "ShoppingCart": "mypackage.models.cart",
+    "Ledger": "mypackage.models.ledger",
+    "InterestAccrual": "mypackage.models.interest",
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
-__all__ = ["Person", "Product"]
+__getattr__, __dir__ = attach(__name__, globals(), _LAZY_IMPORTS)
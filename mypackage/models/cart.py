@@ -0,0 +1,162 @@
+"""
+Shopping cart model
+Cart with merged lines, running totals and batched checkout
+"""
+
+from mypackage.models.checkout import checkout_batch
+from mypackage.models.person import Person
+from mypackage.models.product import Product
+from mypackage.utils.calculator import percentage
+from mypackage.utils.formatter import format_currency
+
+
+class ShoppingCart:
+    """
+    Shopping cart using our package
+
+    Each product has a single line in the cart, and the subtotal is
+    updated on every add/remove instead of being recomputed.
+    """
+
+    def __init__(self, customer):
+        """Initialize an empty cart"""
+        self.customer = customer
+        self.items = {}  # product -> {"product", "quantity", "price"}
+        self._subtotal = 0
+
+    def add_item(self, product, quantity=1):
+        """Add product to cart, merging with an existing line"""
+        if quantity <= 0:
+            return f"❌ Invalid quantity: {quantity}"
+        if not product.is_in_stock():
+            return f"❌ {product.name} is out of stock!"
+
+        line = self.items.get(product)
+        in_cart = line["quantity"] if line else 0
+        if in_cart + quantity > product.quantity:
+            return f"❌ Only {product.quantity} units available!"
+
+        if line is None:
+            line = {"product": product, "quantity": 0, "price": product.price}
+            self.items[product] = line
+        line["quantity"] += quantity
+        self._subtotal += line["price"] * quantity
+        return f"✅ Added {quantity}x {product.name} to cart"
+
+    def remove_item(self, product, quantity=None):
+        """Remove some (or by default all) units of a product from the cart"""
+        line = self.items.get(product)
+        if line is None:
+            return f"❌ {product.name} is not in the cart!"
+        if quantity is not None and quantity <= 0:
+            return f"❌ Invalid quantity: {quantity}"
+
+        if quantity is None or quantity >= line["quantity"]:
+            quantity = line["quantity"]
+            del self.items[product]
+        else:
+            line["quantity"] -= quantity
+        self._subtotal -= line["price"] * quantity
+        if not self.items:
+            self._subtotal = 0  # drop any float drift once the cart is empty
+        return f"✅ Removed {quantity}x {product.name} from cart"
+
+    def clear(self):
+        """Empty the cart"""
+        self.items = {}
+        self._subtotal = 0
+
+    def get_subtotal(self):
+        """Return the running subtotal"""
+        return self._subtotal
+
+    def get_tax(self):
+        """Calculate tax"""
+        return self._subtotal * Product.tax_rate
+
+    def get_total(self):
+        """Calculate total with tax"""
+        return self._subtotal * (1 + Product.tax_rate)
+
+    def checkout(self):
+        """Take this cart's items out of stock and empty it"""
+        if not self.items:
+            return "Cart is empty!"
+        total = self.get_total()
+        completed, _ = checkout_carts([self])
+        if not completed:
+            return "❌ Checkout failed: not enough stock"
+        return f"✅ Checkout successful! Total: {format_currency(total)}"
+
+    def show_cart(self):
+        """Display cart contents"""
+        print(f"🛒 Shopping Cart for {self.customer.get_full_name()}")
+        print("-" * 90)
+
+        if not self.items:
+            print("Cart is empty")
+            return
+
+        for i, item in enumerate(self.items.values(), 1):
+            product = item["product"]
+            qty = item["quantity"]
+            price = item["price"]
+            total = price * qty
+            print(f"{i}. {product.name}")
+            print(f"   {qty} × {format_currency(price)} = {format_currency(total)}")
+
+        print("-" * 90)
+        print(f"Subtotal: {format_currency(self.get_subtotal())}")
+        print(
+            f"Tax ({percentage(Product.tax_rate * 100, 100):.0f}%): {format_currency(self.get_tax())}"
+        )
+        print(f"TOTAL: {format_currency(self.get_total())}")
+
+
+def _cart_lines(cart):
+    """Return a cart's (product, quantity) pairs"""
+    return ((line["product"], line["quantity"]) for line in cart.items.values())
+
+
+def checkout_carts(carts, on_change=None):
+    """
+    Check out many carts together
+
+    Carts are served in order against a running tally of remaining stock.
+    A cart that doesn't fit in full is rejected and left untouched. Each
+    affected Product has its quantity written once, at the end.
+
+    Returns (completed, rejected) lists of carts. Completed carts are
+    emptied. on_change is passed on to checkout_batch.
+    """
+    completed, rejected = checkout_batch(
+        carts, _cart_lines, stock_attr="quantity", on_change=on_change
+    )
+    for cart in completed:
+        cart.clear()
+    return completed, [cart for cart, _ in rejected]
+
+
+if __name__ == "__main__":
+    print("Shopping Cart Test")
+
+    mouse = Product("Wireless Mouse", 29.99, 5, "Electronics")
+    cable = Product("USB-C Cable", 15.99, 200, "Accessories")
+
+    cart = ShoppingCart(Person("Sarah", "Wilson", 32))
+    print(cart.add_item(mouse, 2))
+    print(cart.add_item(mouse, 1))
+    print(cart.add_item(cable, 3))
+    print(cart.remove_item(cable, 1))
+    cart.show_cart()
+    print()
+
+    carts = []
+    for n in range(4):
+        batch_cart = ShoppingCart(Person("Customer", str(n), 30))
+        batch_cart.add_item(mouse, 1)
+        batch_cart.add_item(cable, 10)
+        carts.append(batch_cart)
+    completed, rejected = checkout_carts([cart] + carts)
+    print(f"Batch checkout: {len(completed)} completed, {len(rejected)} rejected")
+    print(f"Stock left: {mouse}, {cable}")
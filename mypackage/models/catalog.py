@@ -0,0 +1,175 @@
+"""
+Product catalog
+Stores many products in parallel columns instead of one object each
+"""
+
+from array import array
+
+from mypackage.models.product import Product
+from mypackage.utils.calculator import multiply_many
+
+
+class CatalogProduct(Product):
+    """
+    A lightweight Product view onto one row of a ProductCatalog
+
+    Reading or writing name, price, quantity or category goes straight
+    to the catalog columns, so every Product method (add_stock,
+    apply_discount, get_info, ...) works on the stored row. Views are
+    made on demand and not kept; two views of the same row compare and
+    hash equal, so either can key a dict (carts, stock reservations).
+    """
+
+    __slots__ = ("_catalog", "_index")
+
+    def __init__(self, catalog, index):
+        """Point the view at a catalog row (does not call Product.__init__)"""
+        self._catalog = catalog
+        self._index = index
+
+    def __eq__(self, other):
+        if not isinstance(other, CatalogProduct):
+            return NotImplemented
+        return self._catalog is other._catalog and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._catalog), self._index))
+
+    @property
+    def name(self):
+        return self._catalog._names[self._index]
+
+    @name.setter
+    def name(self, value):
+        self._catalog._names[self._index] = value
+
+    @property
+    def price(self):
+        return self._catalog._prices[self._index]
+
+    @price.setter
+    def price(self, value):
+        self._catalog._prices[self._index] = value
+
+    @property
+    def quantity(self):
+        return self._catalog._quantities[self._index]
+
+    @quantity.setter
+    def quantity(self, value):
+        self._catalog._quantities[self._index] = value
+
+    @property
+    def category(self):
+        catalog = self._catalog
+        return catalog._categories[catalog._category_codes[self._index]]
+
+    @category.setter
+    def category(self, value):
+        catalog = self._catalog
+        catalog._category_codes[self._index] = catalog._category_code(value)
+
+
+class ProductCatalog:
+    """
+    A column store for products
+
+    Prices are kept in a float array, quantities in an integer array and
+    categories as small integer codes into a table of unique names.
+    """
+
+    def __init__(self, products=()):
+        """Create a catalog, optionally filled from existing Products"""
+        self._names = []
+        self._prices = array("d")
+        self._quantities = array("q")
+        self._category_codes = array("I")
+        self._categories = []
+        self._category_index = {}
+        for product in products:
+            self._append(
+                product.name, product.price, product.quantity, product.category
+            )
+
+    def _category_code(self, category):
+        """Return the code for a category, registering it if new"""
+        code = self._category_index.get(category)
+        if code is None:
+            code = len(self._categories)
+            self._categories.append(category)
+            self._category_index[category] = code
+        return code
+
+    def _append(self, name, price, quantity, category):
+        """Append a product row"""
+        self._names.append(name)
+        self._prices.append(price)
+        self._quantities.append(quantity)
+        self._category_codes.append(self._category_code(category))
+
+    def add(self, name, price, quantity=0, category="General"):
+        """Append a product row and return a view onto it"""
+        self._append(name, price, quantity, category)
+        return CatalogProduct(self, len(self._names) - 1)
+
+    def get_categories(self):
+        """Return the distinct categories in insertion order"""
+        return list(self._categories)
+
+    def get_total_values(self):
+        """Return price * quantity for every product"""
+        return multiply_many(self._prices, self._quantities)
+
+    def get_prices_with_tax(self):
+        """Return the taxed price of every product"""
+        return multiply_many(self._prices, 1 + Product.tax_rate)
+
+    def get_in_stock(self):
+        """Return True/False per product for whether it is in stock"""
+        return [quantity > 0 for quantity in self._quantities]
+
+    def get_total_value(self):
+        """Return the inventory value of the whole catalog"""
+        return sum(self.get_total_values())
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        """Return a view onto the product at index"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("catalog index out of range")
+        return CatalogProduct(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield CatalogProduct(self, index)
+
+    def __repr__(self):
+        return f"ProductCatalog({len(self)} products)"
+
+
+if __name__ == "__main__":
+    print("Product Catalog Test")
+
+    catalog = ProductCatalog(
+        [
+            Product("Laptop", 999.99, 50, "Electronics"),
+            Product("Mouse", 29.99, 0, "Electronics"),
+            Product("Python Guide", 39.99, 100, "Books"),
+        ]
+    )
+    print(catalog)
+    print(f"Categories: {catalog.get_categories()}")
+    print(f"Total values: {list(catalog.get_total_values())}")
+    print(f"In stock: {catalog.get_in_stock()}")
+    print(f"Catalog value: ${catalog.get_total_value():,.2f}")
+    print()
+
+    laptop = catalog[0]
+    assert laptop == catalog[0] and laptop in {product for product in catalog}
+    print(laptop.remove_stock(10))
+    print(laptop.apply_discount(10))
+    print(laptop.get_info())
@@ -0,0 +1,96 @@
+"""
+Checkout engine
+Two-phase, all-or-nothing checkout for batches of orders
+"""
+
+
+def checkout_batch(orders, get_lines, stock_attr="stock", on_change=None):
+    """
+    Check out many orders against product stock in one batch
+
+    get_lines(order) yields (product, quantity) pairs, and each product
+    keeps its stock in the attribute named stock_attr. Lines for the same
+    product are merged before checking, so an order that asks for one
+    product twice can't slip past the stock check.
+
+    Phase 1 validates and reserves every order in turn against a running
+    tally of stock; an order that doesn't fit in full, or has a line
+    quantity below 1, is rejected and reserves nothing. Phase 2 writes
+    each affected product's stock once. Nothing here is locked: batches
+    that may race with other stock changes should go through a
+    StockManager instead. on_change, if given, is called once with the
+    products whose stock was written (Inventory.update_stock fits).
+
+    Returns (completed, rejected): the completed orders, and
+    (order, product) pairs naming the product that got each order
+    rejected.
+    """
+    snapshot = {}  # product -> stock when first seen
+    remaining = {}
+    completed = []
+    rejected = []
+
+    # Phase 1: validate and reserve
+    for order in orders:
+        needed = {}
+        short = None
+        for product, quantity in get_lines(order):
+            if quantity < 1:
+                short = product
+                break
+            needed[product] = needed.get(product, 0) + quantity
+
+        if short is None:
+            for product, quantity in needed.items():
+                if product not in remaining:
+                    stock = getattr(product, stock_attr)
+                    snapshot[product] = stock
+                    remaining[product] = stock
+                if quantity > remaining[product]:
+                    short = product
+                    break
+
+        if short is not None:
+            rejected.append((order, short))
+            continue
+        for product, quantity in needed.items():
+            remaining[product] -= quantity
+        completed.append(order)
+
+    # Phase 2: write each product's stock once
+    changed = [p for p, stock in remaining.items() if stock != snapshot[p]]
+    for product in changed:
+        setattr(product, stock_attr, remaining[product])
+    if on_change is not None and changed:
+        on_change(changed)
+    return completed, rejected
+
+
+if __name__ == "__main__":
+    import time
+
+    from mypackage.models.product import Product
+
+    print("Checkout Engine Test")
+
+    products = [Product(f"Item {i}", 9.99, 500, "Test") for i in range(100)]
+    orders = [
+        [(products[(n * 7 + k) % 100], 1 + k % 3) for k in range(5)]
+        for n in range(20_000)
+    ]
+
+    start = time.perf_counter()
+    completed, rejected = checkout_batch(orders, lambda order: order, "quantity")
+    elapsed = time.perf_counter() - start
+
+    assert all(product.quantity >= 0 for product in products)
+    # A bad line rejects its own order, not the whole batch
+    pen, ink = Product("Pen", 1.5, 10, "Test"), Product("Ink", 4.0, 10, "Test")
+    bad_order, good_order = [(pen, 1), (ink, 0)], [(pen, 2)]
+    done, refused = checkout_batch([bad_order, good_order], lambda o: o, "quantity")
+    assert done == [good_order] and refused == [(bad_order, ink)]
+    assert (pen.quantity, ink.quantity) == (8, 10)
+    print(
+        f"{len(orders):,} orders in {elapsed * 1000:.1f} ms: "
+        f"{len(completed):,} completed, {len(rejected):,} rejected"
+    )
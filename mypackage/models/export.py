@@ -0,0 +1,95 @@
+"""
+Export module
+Streams Person and Product records as text, CSV or JSON Lines
+"""
+
+import csv
+import io
+import json
+import sys
+
+from mypackage.models.person import Person
+from mypackage.models.product import Product
+
+PERSON_FIELDS = ("first_name", "last_name", "age", "email")
+PRODUCT_FIELDS = ("name", "category", "price", "quantity")
+
+FORMATS = ("text", "csv", "jsonl")
+
+
+def get_fields(record):
+    """Return the exported field names for a Person or Product"""
+    if isinstance(record, Product):
+        return PRODUCT_FIELDS
+    if isinstance(record, Person):
+        return PERSON_FIELDS
+    raise TypeError(f"Cannot export {type(record).__name__} records")
+
+
+def render_records(records, fmt="text", fields=None, chunk_size=1000):
+    """
+    Render records lazily, yielding one string per chunk_size records
+
+    Only one chunk is held in memory at a time, so records can come from
+    a generator of any length. For csv and jsonl the fields default to
+    those of the first record; text uses each record's get_info().
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {FORMATS}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    pending = 0
+    header_written = False
+
+    for record in records:
+        if fields is None:
+            fields = get_fields(record)
+        if writer is not None and not header_written:
+            writer.writerow(fields)
+            header_written = True
+
+        if fmt == "text":
+            buffer.write(record.get_info())
+            buffer.write("\n\n")
+        elif fmt == "csv":
+            writer.writerow([getattr(record, field) for field in fields])
+        else:
+            row = {field: getattr(record, field) for field in fields}
+            buffer.write(json.dumps(row, ensure_ascii=False))
+            buffer.write("\n")
+
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if pending:
+        yield buffer.getvalue()
+
+
+def export_records(records, file, fmt="text", fields=None, chunk_size=1000):
+    """Write records to a file-like object chunk by chunk"""
+    for chunk in render_records(records, fmt, fields, chunk_size):
+        file.write(chunk)
+
+
+if __name__ == "__main__":
+    print("Export Module Test")
+
+    products = (Product(f"Item {i}", 9.99 + i, i % 3, "Electronics") for i in range(3))
+    export_records(products, sys.stdout, "csv")
+    print()
+    export_records([Product("a", 1.0)], sys.stdout, "csv", fields=("name", "price"))
+    print()
+
+    people = [
+        Person("John", "Doe", 30, "john@example.com"),
+        Person("Jane", "Smith", 25),
+    ]
+    export_records(people, sys.stdout, "jsonl")
+    print()
+
+    export_records(people[:1], sys.stdout)
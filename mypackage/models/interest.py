@@ -0,0 +1,275 @@
+"""
+Interest model
+Batch interest accrual over columnar account balances
+
+Balances are stored as whole cents in a flat file of 64-bit integers.
+Interest is computed with exact integer arithmetic (rounding half to
+even), split into chunks and processed by a pool of worker processes.
+
+The input file is never modified while the job runs: each chunk's new
+balances go to a separate output file and a JSON checkpoint records
+which chunks are finished. Re-running after a crash skips finished
+chunks and recomputes the rest from the untouched input, so no account
+is credited twice. The output replaces the input only once every
+chunk is done.
+"""
+
+import json
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from decimal import ROUND_HALF_EVEN, Decimal
+from fractions import Fraction
+
+ITEM_SIZE = array("q").itemsize
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def to_cents(amount):
+    """Convert a dollar amount (float, str or Decimal) to whole cents"""
+    cents = Decimal(str(amount)) * 100
+    return int(cents.quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+
+def save_balances(path, amounts):
+    """Write dollar amounts to path as a column of integer cents"""
+    with open(path, "wb") as file:
+        array("q", map(to_cents, amounts)).tofile(file)
+
+
+def load_balances(path):
+    """Read a column of integer cents from path"""
+    balances = array("q")
+    with open(path, "rb") as file:
+        balances.frombytes(file.read())
+    return balances
+
+
+def _write_json_atomic(path, data):
+    """Replace path with data without ever leaving a half-written file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as file:
+        json.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def _accrue_chunk(task):
+    """Worker: credit interest to one chunk, return (chunk index, interest in cents)"""
+    input_path, output_path, index, chunk_size, numerator, denominator = task
+    offset = index * chunk_size * ITEM_SIZE
+
+    balances = array("q")
+    with open(input_path, "rb") as file:
+        file.seek(offset)
+        balances.frombytes(file.read(chunk_size * ITEM_SIZE))
+
+    total = 0
+    for i, cents in enumerate(balances):
+        if cents <= 0:
+            continue
+        interest, remainder = divmod(cents * numerator, denominator)
+        # Round half to even
+        if 2 * remainder > denominator or (2 * remainder == denominator and interest & 1):
+            interest += 1
+        balances[i] = cents + interest
+        total += interest
+
+    with open(output_path, "r+b") as file:
+        file.seek(offset)
+        file.write(balances.tobytes())
+        file.flush()
+        os.fsync(file.fileno())
+    return index, total
+
+
+class InterestAccrual:
+    """
+    One interest run over a balances file
+
+    The period rate is rate / periods_per_year, kept as an exact fraction.
+    """
+
+    def __init__(
+        self,
+        balances_path,
+        rate,
+        periods_per_year=12,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        workers=None,
+    ):
+        """Set up an accrual run (workers=0 runs in this process)"""
+        self.balances_path = balances_path
+        self.rate = str(rate)
+        self.periods_per_year = periods_per_year
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.output_path = balances_path + ".accrual"
+        self.checkpoint_path = balances_path + ".checkpoint"
+        self._period_rate = Fraction(self.rate) / periods_per_year
+
+    def _run_key(self, count):
+        """Parameters a checkpoint must match to be resumed"""
+        return {
+            "rate": self.rate,
+            "periods_per_year": self.periods_per_year,
+            "chunk_size": self.chunk_size,
+            "count": count,
+        }
+
+    def _load_checkpoint(self, count):
+        """
+        Return ({chunk index: interest} already done, committed flag)
+
+        A committed checkpoint means every chunk is done and the output
+        may already have replaced the input, so its work must not be redone.
+        """
+        key = self._run_key(count)
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as file:
+                checkpoint = json.load(file)
+            if checkpoint["run"] != key:
+                raise ValueError(
+                    f"{self.checkpoint_path} belongs to a different run: {checkpoint['run']}"
+                )
+            done = {int(i): total for i, total in checkpoint["done"].items()}
+            if checkpoint.get("committed"):
+                return done, True
+            if os.path.exists(self.output_path):
+                return done, False
+
+        # Fresh run: make an output file of the right size, then checkpoint it
+        with open(self.output_path, "wb") as file:
+            file.truncate(count * ITEM_SIZE)
+        _write_json_atomic(self.checkpoint_path, {"run": key, "done": {}})
+        return {}, False
+
+    def _pending_tasks(self, count, done):
+        """Return worker tasks for the chunks not yet in done"""
+        chunk_count = -(-count // self.chunk_size)
+        return [
+            (
+                self.balances_path,
+                self.output_path,
+                index,
+                self.chunk_size,
+                self._period_rate.numerator,
+                self._period_rate.denominator,
+            )
+            for index in range(chunk_count)
+            if index not in done
+        ]
+
+    def run(self):
+        """Credit one period of interest to every balance, return total interest in cents"""
+        count = os.path.getsize(self.balances_path) // ITEM_SIZE
+        done, committed = self._load_checkpoint(count)
+        run_key = self._run_key(count)
+        if not committed:
+            tasks = self._pending_tasks(count, done)
+            if self.workers == 0:
+                self._collect(map(_accrue_chunk, tasks), done, run_key)
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    self._collect(pool.map(_accrue_chunk, tasks), done, run_key)
+            # Mark the run finished before the output replaces the input, so a
+            # crash between the two steps below can't lead to a second credit
+            _write_json_atomic(
+                self.checkpoint_path, {"run": run_key, "done": done, "committed": True}
+            )
+
+        if os.path.exists(self.output_path):
+            os.replace(self.output_path, self.balances_path)
+        os.remove(self.checkpoint_path)
+        return sum(done.values())
+
+    def _collect(self, results, done, run_key):
+        """Checkpoint each finished chunk as its result arrives"""
+        for index, total in results:
+            done[index] = total
+            _write_json_atomic(self.checkpoint_path, {"run": run_key, "done": done})
+
+
+def accrue_accounts(accounts, rate, periods_per_year=12, workers=0):
+    """
+    Credit one period of interest to in-memory accounts
+
+    Each account needs a balance (in dollars) and a deposit(amount)
+    method; the interest is deposited so it shows up in the account's
+    history. Returns the total interest in dollars as a Decimal.
+    """
+    accounts = list(accounts)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "balances.bin")
+        save_balances(path, (account.balance for account in accounts))
+        before = load_balances(path)
+        total = InterestAccrual(path, rate, periods_per_year, workers=workers).run()
+        after = load_balances(path)
+
+    for account, old, new in zip(accounts, before, after):
+        if new != old:
+            account.deposit(float(Decimal(new - old) / 100))
+    return Decimal(total) / 100
+
+
+if __name__ == "__main__":
+    import time
+
+    print("Interest Model Test")
+
+    count = 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "balances.bin")
+        with open(path, "wb") as file:
+            array("q", (i * 7919 % 5_000_000 for i in range(count))).tofile(file)
+        before = load_balances(path)
+
+        # Simulate a crash after the first two chunks are checkpointed
+        job = InterestAccrual(path, "0.03", chunk_size=50_000)
+        done, _ = job._load_checkpoint(count)
+        crashed = job._pending_tasks(count, done)[:2]
+        job._collect(map(_accrue_chunk, crashed), done, job._run_key(count))
+
+        start = time.perf_counter()
+        total = InterestAccrual(path, "0.03", chunk_size=50_000).run()
+        elapsed = time.perf_counter() - start
+        after = load_balances(path)
+
+        rate = Fraction("0.03") / 12
+        for i in range(0, count, 997):
+            assert after[i] == before[i] + round(before[i] * rate), i
+        assert total == sum(after) - sum(before)
+        print(f"Resumed run credited ${Decimal(total) / 100:,.2f} in {elapsed:.2f} s")
+
+        # Simulate a crash after the output replaced the input but before
+        # the checkpoint was removed: the rerun must not credit again
+        job = InterestAccrual(path, "0.03", chunk_size=50_000, workers=0)
+        done, _ = job._load_checkpoint(count)
+        tasks = job._pending_tasks(count, done)
+        job._collect(map(_accrue_chunk, tasks), done, job._run_key(count))
+        _write_json_atomic(
+            job.checkpoint_path,
+            {"run": job._run_key(count), "done": done, "committed": True},
+        )
+        os.replace(job.output_path, path)
+        credited = load_balances(path)
+        assert credited != after
+        rerun = InterestAccrual(path, "0.03", chunk_size=50_000).run()
+        assert rerun == sum(done.values())
+        assert load_balances(path) == credited, "interest credited twice"
+        assert not os.path.exists(job.checkpoint_path)
+        print("Crash after commit: rerun finished without crediting again")
+
+    class Account:
+        def __init__(self, balance):
+            self.balance = balance
+
+        def deposit(self, amount):
+            self.balance += amount
+
+    accounts = [Account(1000), Account(250.5), Account(0)]
+    print(f"Interest on 3 accounts: ${accrue_accounts(accounts, 0.03)}")
+    print([account.balance for account in accounts])
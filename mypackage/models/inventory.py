@@ -0,0 +1,166 @@
+"""
+Inventory model
+Indexed collection of products for fast category, price and stock lookups
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+from mypackage.models.product import Product
+
+
+class Inventory:
+    """
+    A collection of products with lookup indexes
+
+    Keeps a hash index on category, a sorted price index and the set of
+    in-stock products. Price changes must go through apply_discount on
+    the inventory so the price index stays in sync. Stock changes made
+    through add_stock and remove_stock are indexed at once; stock changed
+    elsewhere (checkout_batch, StockManager, Product.remove_stock) should
+    be reported with update_stock, which those take as their on_change
+    hook. Sold-out products are never returned by find_in_stock, even if
+    a change went unreported.
+    """
+
+    def __init__(self, products=()):
+        """Create an inventory, optionally filled with products"""
+        self._by_category = {}
+        self._price_keys = []  # sorted (price, seq) pairs
+        self._by_seq = {}
+        self._keys = {}  # product -> its (price, seq) key
+        self._in_stock = {}  # dicts double as insertion-ordered sets
+        self._next_seq = 0
+        for product in products:
+            self.add(product)
+
+    def add(self, product):
+        """Add a product to the inventory and its indexes"""
+        if product in self._keys:
+            raise ValueError(f"{product.name} is already in the inventory")
+        key = (product.price, self._next_seq)
+        self._next_seq += 1
+        self._keys[product] = key
+        self._by_seq[key[1]] = product
+        insort(self._price_keys, key)
+        self._by_category.setdefault(product.category, {})[product] = None
+        if product.is_in_stock():
+            self._in_stock[product] = None
+
+    def remove(self, product):
+        """Remove a product from the inventory and its indexes"""
+        key = self._keys.pop(product, None)
+        if key is None:
+            raise ValueError(f"{product.name} is not in the inventory")
+        del self._by_seq[key[1]]
+        del self._price_keys[bisect_left(self._price_keys, key)]
+        members = self._by_category[product.category]
+        del members[product]
+        if not members:
+            del self._by_category[product.category]
+        self._in_stock.pop(product, None)
+
+    def _check_member(self, product):
+        """Raise if product isn't tracked by this inventory"""
+        if product not in self._keys:
+            raise ValueError(f"{product.name} is not in the inventory")
+
+    def _update_stock_index(self, product):
+        """Move product in or out of the in-stock set"""
+        if product.is_in_stock():
+            self._in_stock[product] = None
+        else:
+            self._in_stock.pop(product, None)
+
+    def add_stock(self, product, amount):
+        """Add stock to a product and update the indexes"""
+        self._check_member(product)
+        message = product.add_stock(amount)
+        self._update_stock_index(product)
+        return message
+
+    def remove_stock(self, product, amount):
+        """Remove stock from a product and update the indexes"""
+        self._check_member(product)
+        message = product.remove_stock(amount)
+        self._update_stock_index(product)
+        return message
+
+    def update_stock(self, products):
+        """Re-index the stock of products changed outside the inventory"""
+        for product in products:
+            if product in self._keys:
+                self._update_stock_index(product)
+
+    def apply_discount(self, product, discount_percentage):
+        """Discount a product and move it within the price index"""
+        self._check_member(product)
+        old_key = self._keys[product]
+        message = product.apply_discount(discount_percentage)
+        del self._price_keys[bisect_left(self._price_keys, old_key)]
+        new_key = (product.price, old_key[1])
+        self._keys[product] = new_key
+        insort(self._price_keys, new_key)
+        return message
+
+    def find_by_category(self, category):
+        """Return the products in a category"""
+        return list(self._by_category.get(category, ()))
+
+    def find_in_price_range(self, low, high):
+        """Return products with low <= price <= high, cheapest first"""
+        start = bisect_left(self._price_keys, (low, -1))
+        stop = bisect_right(self._price_keys, (high, float("inf")))
+        return [self._by_seq[seq] for _, seq in self._price_keys[start:stop]]
+
+    def find_in_stock(self):
+        """Return the products that are in stock"""
+        sold_out = [p for p in self._in_stock if not p.is_in_stock()]
+        for product in sold_out:
+            # Sold out without update_stock being told
+            del self._in_stock[product]
+        return list(self._in_stock)
+
+    def get_categories(self):
+        """Return the categories that have at least one product"""
+        return list(self._by_category)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, product):
+        return product in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __repr__(self):
+        return f"Inventory({len(self)} products)"
+
+
+if __name__ == "__main__":
+    print("Inventory Model Test")
+
+    laptop = Product("Laptop", 999.99, 50, "Electronics")
+    mouse = Product("Mouse", 29.99, 0, "Electronics")
+    book = Product("Python Guide", 39.99, 100, "Books")
+    inventory = Inventory([laptop, mouse, book])
+    print(inventory)
+
+    print(f"Electronics: {inventory.find_by_category('Electronics')}")
+    print(f"$20-$50: {inventory.find_in_price_range(20, 50)}")
+    print(f"In stock: {inventory.find_in_stock()}")
+    print()
+
+    print(inventory.add_stock(mouse, 5))
+    print(inventory.apply_discount(laptop, 96))
+    print(f"$20-$50: {inventory.find_in_price_range(20, 50)}")
+    print(f"In stock: {inventory.find_in_stock()}")
+    print()
+
+    # Stock sold elsewhere is reported through the on_change hook
+    from mypackage.models.checkout import checkout_batch
+
+    orders = [[(mouse, 5)]]
+    checkout_batch(orders, lambda order: order, "quantity", inventory.update_stock)
+    assert mouse not in inventory.find_in_stock()
+    print(f"After selling every mouse: {inventory.find_in_stock()}")
@@ -0,0 +1,114 @@
+"""
+Ledger model
+Append-only, array-backed transaction history for an account
+"""
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+DEPOSIT = 0
+WITHDRAWAL = 1
+
+_LABELS = {DEPOSIT: ("Deposit", "+"), WITHDRAWAL: ("Withdrawal", "-")}
+
+
+class Ledger:
+    """
+    Transaction history stored as packed columns
+
+    Each transaction is a (timestamp, kind, amount) record kept in typed
+    arrays, along with the balance after it. Timestamps never decrease,
+    so balance-at-time and time-range queries use binary search. The
+    old "Deposit: +$12.00" text is only built when a record is read as
+    a string (indexing or iterating the ledger).
+    """
+
+    def __init__(self, opening_balance=0):
+        """Create an empty ledger for an account starting at opening_balance"""
+        self.opening_balance = opening_balance
+        self._timestamps = array("d")
+        self._kinds = array("b")
+        self._amounts = array("d")
+        self._balances = array("d")
+
+    def record(self, kind, amount, timestamp=None):
+        """
+        Append a DEPOSIT or WITHDRAWAL record
+
+        timestamp defaults to now; a given timestamp older than the last
+        record raises ValueError, since records must stay in time order.
+        """
+        if kind not in _LABELS:
+            raise ValueError(f"Unknown transaction kind: {kind}")
+        last = self._timestamps[-1] if self._timestamps else None
+        if timestamp is None:
+            timestamp = time.time()
+            if last is not None and timestamp < last:
+                timestamp = last  # the clock stepped back; keep the log sorted
+        elif last is not None and timestamp < last:
+            raise ValueError(
+                f"Timestamp {timestamp} is older than the last record ({last})"
+            )
+        balance = self._balances[-1] if self._balances else self.opening_balance
+        balance += amount if kind == DEPOSIT else -amount
+        self._timestamps.append(timestamp)
+        self._kinds.append(kind)
+        self._amounts.append(amount)
+        self._balances.append(balance)
+
+    def get_record(self, index):
+        """Return the (timestamp, kind, amount) record at index"""
+        return self._timestamps[index], self._kinds[index], self._amounts[index]
+
+    def get_balance_at(self, timestamp):
+        """Return the balance after every transaction at or before timestamp"""
+        index = bisect_right(self._timestamps, timestamp)
+        return self._balances[index - 1] if index else self.opening_balance
+
+    def get_range(self, start, end):
+        """Return records with start <= timestamp <= end, oldest first"""
+        first = bisect_left(self._timestamps, start)
+        last = bisect_right(self._timestamps, end)
+        return [self.get_record(i) for i in range(first, last)]
+
+    def render(self, index):
+        """Return the text form of one record, e.g. 'Deposit: +$12.00'"""
+        label, sign = _LABELS[self._kinds[index]]
+        return f"{label}: {sign}${self._amounts[index]:.2f}"
+
+    def __len__(self):
+        return len(self._kinds)
+
+    def __getitem__(self, index):
+        """Return the text form of the record at index"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ledger index out of range")
+        return self.render(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.render(index)
+
+    def __repr__(self):
+        return f"Ledger({len(self)} transactions)"
+
+
+if __name__ == "__main__":
+    print("Ledger Model Test")
+
+    ledger = Ledger(opening_balance=100)
+    ledger.record(DEPOSIT, 50, timestamp=10)
+    ledger.record(WITHDRAWAL, 30, timestamp=20)
+    ledger.record(DEPOSIT, 12, timestamp=30)
+    print(ledger)
+    print(list(ledger))
+    print(f"Balance at t=5: {ledger.get_balance_at(5)}")
+    print(f"Balance at t=25: {ledger.get_balance_at(25)}")
+    print(f"Records t=15..30: {ledger.get_range(15, 30)}")
+    try:
+        ledger.record(DEPOSIT, 5, timestamp=25)
+    except ValueError as e:
+        print(f"Backdated record refused: {e}")
@@ -0,0 +1,194 @@
+"""
+Payments model
+Asyncio payment pipeline with per-method concurrency limits
+
+Works with any payment method that has validate() and
+process_payment(amount), like the PaymentMethod classes in
+classes_objects_tutorial.py. The charge itself goes through a gateway;
+StubGateway stands in for a real one with configurable latency.
+"""
+
+import asyncio
+import math
+import random
+import time
+
+
+class PaymentResult:
+    """Outcome of one payment"""
+
+    __slots__ = ("method", "amount", "ok", "message", "latency")
+
+    def __init__(self, method, amount, ok, message, latency=0.0):
+        """Initialize a result (latency in seconds)"""
+        self.method = method
+        self.amount = amount
+        self.ok = ok
+        self.message = message
+        self.latency = latency
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        """Developer representation"""
+        status = "ok" if self.ok else "failed"
+        return f"PaymentResult({self.method}, {self.amount:.2f}, {status})"
+
+
+class StubGateway:
+    """
+    Local stand-in for a payment gateway
+
+    Each charge sleeps for latency seconds, give or take jitter (a
+    fraction of latency), and is declined with probability failure_rate.
+    """
+
+    def __init__(self, latency=0.005, jitter=0.5, failure_rate=0.0, seed=None):
+        """Initialize a gateway"""
+        if not 0 <= failure_rate <= 1:
+            raise ValueError("failure_rate must be between 0 and 1")
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+
+    async def charge(self, method_name, amount):
+        """Charge amount, return True if approved"""
+        spread = self.latency * self.jitter
+        await asyncio.sleep(self.latency + self._random.uniform(-spread, spread))
+        return self._random.random() >= self.failure_rate
+
+
+async def charge(method, amount, gateway):
+    """
+    Async variant of method.process_payment that charges through gateway
+
+    A gateway error (timeout, connection reset, ...) fails this payment
+    only: it comes back as a failed PaymentResult with the error message.
+    """
+    name = type(method).__name__
+    if not method.validate():
+        return PaymentResult(name, amount, False, method.process_payment(amount))
+    try:
+        approved = await gateway.charge(name, amount)
+    except Exception as e:
+        return PaymentResult(name, amount, False, f"❌ Gateway error: {e}")
+    if not approved:
+        return PaymentResult(name, amount, False, "❌ Payment declined by gateway")
+    return PaymentResult(name, amount, True, method.process_payment(amount))
+
+
+class PaymentPipeline:
+    """
+    Runs many payments concurrently through one gateway
+
+    Each payment method class (CreditCard, PayPal, ...) gets its own
+    semaphore, so a slow method can't use up every slot. limits maps a
+    class name to its concurrency limit; others use default_limit.
+    """
+
+    def __init__(self, gateway, limits=None, default_limit=64):
+        """Initialize a pipeline"""
+        self.gateway = gateway
+        self.limits = dict(limits or {})
+        self.default_limit = default_limit
+        self._semaphores = {}
+
+    def _semaphore_for(self, name):
+        """Return the semaphore limiting one payment method class"""
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            limit = self.limits.get(name, self.default_limit)
+            semaphore = self._semaphores[name] = asyncio.Semaphore(limit)
+        return semaphore
+
+    async def submit(self, method, amount):
+        """Process one payment; latency includes time spent waiting for a slot"""
+        start = time.perf_counter()
+        async with self._semaphore_for(type(method).__name__):
+            result = await charge(method, amount, self.gateway)
+        result.latency = time.perf_counter() - start
+        return result
+
+    async def run(self, payments):
+        """Process (method, amount) pairs concurrently, results in input order"""
+        return await asyncio.gather(
+            *(self.submit(method, amount) for method, amount in payments)
+        )
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def get_latency_stats(results, elapsed):
+    """Summarize results of a run that took elapsed seconds"""
+    latencies = sorted(result.latency for result in results)
+    succeeded = sum(1 for result in results if result.ok)
+    return {
+        "payments": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "throughput": len(results) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+    }
+
+
+def run_payment_benchmark(methods, count=10_000, gateway=None, limits=None):
+    """Push count payments, cycling through methods, and print throughput and p99"""
+    gateway = gateway or StubGateway(seed=42)
+    payments = [(methods[i % len(methods)], 10 + i % 90) for i in range(count)]
+
+    async def main():
+        pipeline = PaymentPipeline(gateway, limits)
+        start = time.perf_counter()
+        results = await pipeline.run(payments)
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(main())
+    stats = get_latency_stats(results, elapsed)
+    print(
+        f"{stats['payments']:,} payments in {elapsed:.2f} s: "
+        f"{stats['throughput']:,.0f}/s, p50 {stats['p50_ms']:.1f} ms, "
+        f"p99 {stats['p99_ms']:.1f} ms, {stats['failed']:,} failed"
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    print("Payments Model Test")
+
+    class Card:
+        def validate(self):
+            return True
+
+        def process_payment(self, amount):
+            return f"✅ ${amount:.2f} charged to card"
+
+    class Wallet(Card):
+        def process_payment(self, amount):
+            return f"✅ ${amount:.2f} paid from wallet"
+
+    class FlakyGateway(StubGateway):
+        async def charge(self, method_name, amount):
+            if amount == 13:
+                raise ConnectionError("connection reset")
+            return await super().charge(method_name, amount)
+
+    methods = [Card(), Wallet()]
+    pipeline = PaymentPipeline(FlakyGateway())
+    flaky = asyncio.run(pipeline.run([(Card(), 13), (Card(), 20)]))
+    assert [result.ok for result in flaky] == [False, True]
+    print(f"Flaky gateway: {flaky[0].message}")
+
+    gateway = StubGateway(latency=0.005, failure_rate=0.01, seed=1)
+    for limit in (16, 64, 256):
+        print(f"Limit {limit} per method: ", end="")
+        limits = {"Card": limit, "Wallet": limit}
+        run_payment_benchmark(methods, gateway=gateway, limits=limits)
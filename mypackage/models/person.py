@@ -3,14 +3,19 @@ Person model
 Represents a person with basic information
 """
 
+from mypackage.utils.counters import get_counter
+
 
 class Person:
     """
     A class representing a person
     """
 
-    # Class variable to track total persons
-    total_persons = 0
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("first_name", "last_name", "age", "email")
+
+    # Class variable to track total persons (thread-safe, see counters.py)
+    total_persons = get_counter("Person.total_persons")
 
     def __init__(self, first_name, last_name, age, email=None):
         """Initialize a Person"""
@@ -18,7 +23,7 @@ class Person:
         self.last_name = last_name
         self.age = age
         self.email = email
-        Person.total_persons += 1
+        Person.total_persons.increment()
 
     def get_full_name(self):
         """Return full name"""
@@ -59,7 +64,7 @@ class Person:
     @classmethod
     def get_total_persons(cls):
         """Get total number of persons created"""
-        return cls.total_persons
+        return cls.total_persons.get_value()
 
     @staticmethod
     def is_valid_age(age):
@@ -9,6 +9,9 @@ class Product:
     A class representing a product
     """
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("name", "price", "quantity", "category")
+
     # Class variable for tax rate
     tax_rate = 0.08  # 8% tax
 
@@ -0,0 +1,173 @@
+"""
+Stock manager
+Thread-safe stock reservations for Product, using lock striping
+"""
+
+import threading
+import time
+
+from mypackage.models.product import Product
+
+
+class Reservation:
+    """
+    Units of one product held for a pending order
+
+    Created by StockManager.reserve and finished by exactly one call to
+    commit or release.
+    """
+
+    __slots__ = ("product", "amount", "status")
+
+    def __init__(self, product, amount):
+        """Initialize a pending reservation"""
+        self.product = product
+        self.amount = amount
+        self.status = "pending"
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"Reservation({self.product.name!r}, {self.amount}, '{self.status}')"
+
+
+class StockManager:
+    """
+    Coordinates concurrent stock changes on Product objects
+
+    Each product is guarded by one of a fixed pool of locks ("stripes"),
+    picked from the product's identity. Workers touching different
+    products rarely wait on each other, and no lock is stored on the
+    Product itself. on_change, if given, is called with a one-product
+    tuple after each stock change, outside the lock (Inventory.update_stock
+    fits, as long as the inventory is only used from one thread).
+    """
+
+    def __init__(self, stripes=64, on_change=None):
+        """Create a manager with the given number of lock stripes"""
+        if stripes < 1:
+            raise ValueError("Need at least one lock stripe")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._reserved = {}  # product -> units held by pending reservations
+        self.on_change = on_change
+
+    def _changed(self, product):
+        """Report a stock change to on_change"""
+        if self.on_change is not None:
+            self.on_change((product,))
+
+    def _lock_for(self, product):
+        """Return the stripe lock guarding a product"""
+        return self._locks[hash(product) % len(self._locks)]
+
+    def get_reserved(self, product):
+        """Return units of a product held by pending reservations"""
+        return self._reserved.get(product, 0)
+
+    def get_available(self, product):
+        """Return units of a product that can still be reserved"""
+        with self._lock_for(product):
+            return product.quantity - self._reserved.get(product, 0)
+
+    def reserve(self, product, amount):
+        """Hold amount units of a product, or raise ValueError if not enough"""
+        if amount <= 0:
+            raise ValueError("Reservation amount must be positive")
+        with self._lock_for(product):
+            reserved = self._reserved.get(product, 0)
+            available = product.quantity - reserved
+            if amount > available:
+                raise ValueError(f"Not enough stock. Available: {available}")
+            self._reserved[product] = reserved + amount
+        return Reservation(product, amount)
+
+    def _finish(self, reservation, status):
+        """Drop a pending reservation's hold, optionally taking the stock"""
+        product = reservation.product
+        with self._lock_for(product):
+            if reservation.status != "pending":
+                raise ValueError(f"Reservation already {reservation.status}")
+            remaining = self._reserved[product] - reservation.amount
+            if remaining:
+                self._reserved[product] = remaining
+            else:
+                del self._reserved[product]
+            if status == "committed":
+                product.quantity -= reservation.amount
+            reservation.status = status
+
+    def commit(self, reservation):
+        """Take the reserved units out of stock"""
+        self._finish(reservation, "committed")
+        self._changed(reservation.product)
+
+    def release(self, reservation):
+        """Give the reserved units back without changing stock"""
+        self._finish(reservation, "released")
+
+    def add_stock(self, product, amount):
+        """Product.add_stock under the product's lock"""
+        with self._lock_for(product):
+            message = product.add_stock(amount)
+        self._changed(product)
+        return message
+
+    def remove_stock(self, product, amount):
+        """Remove unreserved stock under the product's lock"""
+        with self._lock_for(product):
+            available = product.quantity - self._reserved.get(product, 0)
+            if amount > available:
+                raise ValueError(f"Not enough stock. Available: {available}")
+            message = product.remove_stock(amount)
+        self._changed(product)
+        return message
+
+
+def run_contention_benchmark(thread_counts=(1, 2, 4, 8, 16, 32), stripes=64):
+    """Print reservations per second for reserve+commit across thread counts"""
+    product_count = 1_000
+    per_thread = 20_000
+
+    print(f"Stripes: {stripes}")
+    for threads in thread_counts:
+        products = [Product(f"SKU-{i}", 1.0, 10**9) for i in range(product_count)]
+        manager = StockManager(stripes)
+        start_quantity = sum(p.quantity for p in products)
+
+        def worker(offset):
+            for i in range(per_thread):
+                product = products[(offset + i * 7) % product_count]
+                manager.commit(manager.reserve(product, 1))
+
+        workers = [
+            threading.Thread(target=worker, args=(n * 131,)) for n in range(threads)
+        ]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        sold = start_quantity - sum(p.quantity for p in products)
+        assert sold == threads * per_thread, "lost or duplicated stock update"
+        rate = threads * per_thread / elapsed
+        print(f"  {threads:>2} threads: {rate:>12,.0f} reservations/s")
+
+
+if __name__ == "__main__":
+    print("Stock Manager Test")
+
+    laptop = Product("Laptop", 999.99, 3, "Electronics")
+    manager = StockManager()
+    first = manager.reserve(laptop, 2)
+    print(f"Reserved: {first}, available: {manager.get_available(laptop)}")
+    try:
+        manager.reserve(laptop, 2)
+    except ValueError as e:
+        print(f"Second reservation refused: {e}")
+    manager.commit(first)
+    print(f"Committed: {first}, quantity now {laptop.quantity}")
+    print()
+
+    run_contention_benchmark(stripes=1)
+    run_contention_benchmark()
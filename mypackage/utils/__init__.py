@@ -1,18 +1,23 @@
 """
 Utils subpackage
 Contains utility modules for calculations and formatting
+
+Exports are loaded lazily, see mypackage/__init__.py.
 """
 
-# Import from submodules for easier access
-from mypackage.utils.calculator import add, subtract, multiply, divide
-from mypackage.utils.formatter import format_currency, format_date, format_percentage
+from mypackage._lazy import attach
+
+_LAZY_IMPORTS = {
+    "add": "mypackage.utils.calculator",
+    "subtract": "mypackage.utils.calculator",
+    "multiply": "mypackage.utils.calculator",
+    "divide": "mypackage.utils.calculator",
+    "format_currency": "mypackage.utils.formatter",
+    "format_date": "mypackage.utils.formatter",
+    "format_percentage": "mypackage.utils.formatter",
+    "format_many": "mypackage.utils.formatter",
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
-__all__ = [
-    "add",
-    "subtract",
-    "multiply",
-    "divide",
-    "format_currency",
-    "format_date",
-    "format_percentage",
-]
+__getattr__, __dir__ = attach(__name__, globals(), _LAZY_IMPORTS)
@@ -1,8 +1,20 @@
 """
 Calculator module
 Provides basic arithmetic operations
+
+The *_many functions are batch versions of the scalar operations. They
+take lists, array.array buffers or NumPy arrays (a plain number is
+repeated across the batch) and compute the whole batch in one pass,
+using NumPy when it is installed and a pure-Python loop otherwise.
 """
 
+import functools
+import math
+import numbers
+import time
+from array import array
+from itertools import repeat
+
 
 def add(a, b):
     """Add two numbers"""
@@ -38,16 +50,228 @@ def percentage(part, whole):
     return (part / whole) * 100
 
 
+# Factorials up to this n are memoized in _FACTORIALS
+SMALL_FACTORIAL_LIMIT = 256
+_FACTORIALS = [1, 1]
+
+
+def _odd_product(lo, hi):
+    """Multiply the odd numbers in [lo, hi] by binary splitting"""
+    lo |= 1
+    if hi % 2 == 0:
+        hi -= 1
+    if lo > hi:
+        return 1
+    count = (hi - lo) // 2 + 1
+    if count <= 16:
+        result = 1
+        for i in range(lo, hi + 1, 2):
+            result *= i
+        return result
+    mid = lo + 2 * (count // 2)
+    return _odd_product(lo, mid - 2) * _odd_product(mid, hi)
+
+
+def _range_product(lo, hi):
+    """Multiply the integers in [lo, hi] by binary splitting"""
+    if lo > hi:
+        return 1
+    if hi - lo < 16:
+        result = 1
+        for i in range(lo, hi + 1):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return _range_product(lo, mid) * _range_product(mid + 1, hi)
+
+
+def _split_factorial(n):
+    """
+    Compute n! for large n
+
+    Splits n! into its odd part and a power of two. The odd part is built
+    from products of odd numbers over the ranges (n >> (i + 1), n >> i],
+    each computed by binary splitting so the big multiplications happen
+    between numbers of similar size.
+    """
+    inner = 1
+    outer = 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        inner *= _odd_product((n >> (i + 1)) + 1, n >> i)
+        outer *= inner
+    return outer << (n - bin(n).count("1"))
+
+
 def factorial(n):
     """Calculate factorial of n"""
     if n < 0:
         raise ValueError("Factorial not defined for negative numbers")
     if n == 0 or n == 1:
         return 1
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    if n <= SMALL_FACTORIAL_LIMIT:
+        while len(_FACTORIALS) <= n:
+            _FACTORIALS.append(_FACTORIALS[-1] * len(_FACTORIALS))
+        return _FACTORIALS[n]
+    return _split_factorial(n)
+
+
+def permutations(n, k):
+    """Number of ordered selections of k items from n"""
+    if n < 0 or k < 0:
+        raise ValueError("Permutations not defined for negative numbers")
+    if k > n:
+        return 0
+    return _range_product(n - k + 1, n)
+
+
+def binomial(n, k):
+    """Number of ways to choose k items from n (n choose k)"""
+    if n < 0 or k < 0:
+        raise ValueError("Binomial not defined for negative numbers")
+    if k > n:
+        return 0
+    k = min(k, n - k)
+    return permutations(n, k) // factorial(k)
+
+
+# ============================================================================
+# Batch operations
+# ============================================================================
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numpy():
+    """Import NumPy on first use, None if it is not installed"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _batch_length(a, b):
+    """Return the common length of a batch, scalars broadcast to it"""
+    lengths = {len(x) for x in (a, b) if not isinstance(x, numbers.Number)}
+    if not lengths:
+        raise TypeError("At least one argument must be a sequence")
+    if len(lengths) > 1:
+        raise ValueError("Batch inputs must have the same length")
+    return lengths.pop()
+
+
+def _columns(a, b):
+    """Return two iterables of equal length, repeating scalars"""
+    n = _batch_length(a, b)
+    a = repeat(a, n) if isinstance(a, numbers.Number) else a
+    b = repeat(b, n) if isinstance(b, numbers.Number) else b
+    return a, b
+
+
+def _result_like(values, a, b):
+    """Convert a batch result to the container type of the inputs"""
+    np = _load_numpy()
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        return values
+    if np is not None and isinstance(values, np.ndarray):
+        if isinstance(a, array) or isinstance(b, array):
+            result = array("d")
+            result.frombytes(values.astype("d").tobytes())
+            return result
+        return values.tolist()
+    if isinstance(a, array) or isinstance(b, array):
+        return array("d", values)
+    return values
+
+
+def _elementwise(a, b, np_op, py_op):
+    """
+    Apply np_op to the whole batch with NumPy, or py_op per element without it
+
+    Elements are converted to float on both paths, so the results are
+    floats whether or not NumPy is installed.
+    """
+    np = _load_numpy()
+    if np is not None:
+        _batch_length(a, b)
+        values = np_op(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    else:
+        values = [py_op(float(x), float(y)) for x, y in zip(*_columns(a, b))]
+    return _result_like(values, a, b)
+
+
+def add_many(a, b):
+    """Add two batches element-wise"""
+    return _elementwise(a, b, lambda x, y: x + y, add)
+
+
+def subtract_many(a, b):
+    """Subtract batch b from batch a element-wise"""
+    return _elementwise(a, b, lambda x, y: x - y, subtract)
+
+
+def multiply_many(a, b):
+    """Multiply two batches element-wise"""
+    return _elementwise(a, b, lambda x, y: x * y, multiply)
+
+
+def _float_power(x, y):
+    """
+    x**y for floats, giving NumPy's results where Python would not
+
+    A negative base with a fractional exponent is nan instead of a
+    complex number; overflow and zero to a negative power are infinite
+    instead of raising.
+    """
+    try:
+        value = x**y
+    except (OverflowError, ZeroDivisionError):
+        # Negative base and odd whole exponent keep the base's sign
+        odd = y.is_integer() and y % 2 == 1
+        return math.copysign(math.inf, x) if odd else math.inf
+    return math.nan if isinstance(value, complex) else value
+
+
+def power_many(base, exponent):
+    """Raise each base to the matching exponent (nan or inf where NumPy gives them)"""
+    return _elementwise(base, exponent, lambda x, y: x**y, _float_power)
+
+
+def divide_many(a, b, fill=float("nan")):
+    """
+    Divide batch a by batch b element-wise
+
+    Where the divisor is zero the result is `fill` instead of raising,
+    so one bad row does not abort the whole batch.
+    """
+    np = _load_numpy()
+    if np is not None:
+        _batch_length(a, b)
+        num = np.asarray(a, dtype=float)
+        den = np.asarray(b, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(den == 0, fill, num / den)
+    else:
+        values = [
+            fill if y == 0 else float(x) / float(y) for x, y in zip(*_columns(a, b))
+        ]
+    return _result_like(values, a, b)
+
+
+def percentage_many(part, whole):
+    """Calculate percentages element-wise, 0 wherever whole is 0"""
+    np = _load_numpy()
+    if np is not None:
+        _batch_length(part, whole)
+        num = np.asarray(part, dtype=float)
+        den = np.asarray(whole, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(den == 0, 0.0, num / den * 100)
+    else:
+        values = [
+            0.0 if y == 0 else float(x) / float(y) * 100
+            for x, y in zip(*_columns(part, whole))
+        ]
+    return _result_like(values, part, whole)
 
 
 if __name__ == "__main__":
@@ -59,3 +283,22 @@ if __name__ == "__main__":
     print(f"power(2, 3) = {power(2, 3)}")
     print(f"percentage(25, 100) = {percentage(25, 100)}%")
     print(f"factorial(5) = {factorial(5)}")
+    print(f"binomial(10, 3) = {binomial(10, 3)}")
+    print(f"permutations(10, 3) = {permutations(10, 3)}")
+    print(f"add_many([1, 2], [3, 4]) = {add_many([1, 2], [3, 4])}")
+    print(f"divide_many([1, 2], [0, 4]) = {divide_many([1, 2], [0, 4])}")
+    print(f"percentage_many([5, 5], [0, 20]) = {percentage_many([5, 5], [0, 20])}")
+    print()
+
+    print("Factorial benchmark (ms)")
+    print(f"{'n':>8}{'loop':>12}{'engine':>12}")
+    for n in (1_000, 10_000, 100_000):
+        start = time.perf_counter()
+        expected = 1
+        for i in range(2, n + 1):
+            expected *= i
+        loop_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        assert _split_factorial(n) == expected
+        engine_ms = (time.perf_counter() - start) * 1000
+        print(f"{n:>8}{loop_ms:>12.1f}{engine_ms:>12.1f}")
@@ -0,0 +1,97 @@
+"""
+Counters module
+Thread-safe counters that don't contend on a shared write
+
+Each thread increments its own shard (a one-item list only that thread
+writes to), and reading a counter adds up all the shards. Increments
+never take a lock; only a thread's first increment of a counter does,
+to register its shard.
+"""
+
+import threading
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class ShardedCounter:
+    """A counter sharded per thread and summed on read"""
+
+    def __init__(self, name=""):
+        """Initialize a counter at zero"""
+        self.name = name
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _new_shard(self):
+        """Register a shard for the calling thread"""
+        shard = [0]
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def increment(self, amount=1):
+        """Add amount to the calling thread's shard"""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[0] += amount
+
+    def get_value(self):
+        """Return the total across all threads' shards"""
+        with self._lock:
+            shards = list(self._shards)
+        return sum(shard[0] for shard in shards)
+
+    def __int__(self):
+        return self.get_value()
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"ShardedCounter({self.name!r}, {self.get_value()})"
+
+
+def get_counter(name):
+    """Return the registered counter with this name, creating it if needed"""
+    counter = _registry.get(name)
+    if counter is None:
+        with _registry_lock:
+            counter = _registry.setdefault(name, ShardedCounter(name))
+    return counter
+
+
+def get_counter_values():
+    """Return {name: total} for every registered counter"""
+    with _registry_lock:
+        counters = list(_registry.values())
+    return {counter.name: counter.get_value() for counter in counters}
+
+
+if __name__ == "__main__":
+    from mypackage.models.person import Person
+
+    print("Counters Module Test")
+
+    thread_count = 16
+    per_thread = 20_000
+    before = Person.get_total_persons()
+    counter = get_counter("stress")
+
+    def worker():
+        for _ in range(per_thread):
+            counter.increment()
+            Person("Stress", "Test", 30)
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    expected = thread_count * per_thread
+    assert counter.get_value() == expected, counter
+    assert Person.get_total_persons() - before == expected
+    print(f"✅ {thread_count} threads x {per_thread:,} increments = {expected:,}")
@@ -3,24 +3,69 @@ Formatter module
 Provides formatting utilities for currency, dates, and more
 """
 
+import functools
 from datetime import datetime
 
+# How many compiled formatters (and rendered dates per date formatter) to keep
+FORMATTER_CACHE_SIZE = 128
+DATE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def get_currency_formatter(currency="$", decimal_places=2):
+    """Return a cached function that formats numbers as currency"""
+    template = currency.replace("{", "{{").replace("}", "}}")
+    return (template + "{:,.%df}" % decimal_places).format
+
+
+@functools.lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def get_percentage_formatter(decimal_places=2):
+    """Return a cached function that formats numbers as percentages"""
+    return ("{:.%df}%%" % decimal_places).format
+
+
+@functools.lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def get_date_formatter(format_str="%Y-%m-%d"):
+    """
+    Return a cached function that formats dates with a strftime pattern
+
+    The function remembers the strings it has rendered, so a report
+    column that repeats the same dates only calls strftime once per date.
+    Aware datetimes for one instant in different zones compare equal, so
+    the cache key includes the zone (and fold) as well as the value.
+    """
+
+    @functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+    def render(date_obj, tzinfo, fold):
+        return date_obj.strftime(format_str)
+
+    def format_one(date_obj):
+        tzinfo = getattr(date_obj, "tzinfo", None)
+        return render(date_obj, tzinfo, getattr(date_obj, "fold", 0))
+
+    return format_one
+
 
 def format_currency(amount, currency="$"):
     """Format number as currency"""
-    return f"{currency}{amount:,.2f}"
+    return get_currency_formatter(currency)(amount)
 
 
 def format_date(date_obj=None, format_str="%Y-%m-%d"):
     """Format datetime object as string"""
     if date_obj is None:
         date_obj = datetime.now()
-    return date_obj.strftime(format_str)
+    return get_date_formatter(format_str)(date_obj)
 
 
 def format_percentage(value, decimal_places=2):
     """Format number as percentage"""
-    return f"{value:.{decimal_places}f}%"
+    return get_percentage_formatter(decimal_places)(value)
+
+
+def format_many(values, formatter, separator="\n"):
+    """Format a column of values with one formatter and join them into one string"""
+    return separator.join(map(formatter, values))
 
 
 def format_phone(phone_number):
@@ -58,6 +103,8 @@ if __name__ == "__main__":
     print(f"Currency: {format_currency(1234.56)}")
     print(f"Date: {format_date()}")
     print(f"Percentage: {format_percentage(75.5)}")
+    print(f"Euros: {format_currency(1234.5, '€')}")
+    print(f"Column: {format_many([1, 22.5, 333], get_currency_formatter(), ' | ')}")
     print(f"Phone: {format_phone('1234567890')}")
     print(f"Name: {format_name('john', 'doe')}")
     print(f"File Size: {format_file_size(1536000)}")
@@ -0,0 +1,347 @@
+"""
+Geometry module
+Batch area and perimeter for many shapes at once
+
+Shapes are grouped by type into typed columns (widths and heights,
+radii, side triples) and each group is computed in one pass, with NumPy
+when it is installed. Results come back in the order the shapes were
+added. A shape class joins a group by registering with
+ShapeBatch.register (as classes_objects_tutorial.py does for its
+Rectangle, Circle and Triangle); other shapes fall back to their own
+area()/perimeter().
+"""
+
+import functools
+import math
+import operator
+from array import array
+
+from mypackage.utils.calculator import _load_numpy
+
+RECTANGLE = 0
+CIRCLE = 1
+TRIANGLE = 2
+OTHER = 3
+_KINDS = (RECTANGLE, CIRCLE, TRIANGLE, OTHER)
+
+_registered = {}  # shape class -> kind, see ShapeBatch.register
+_kind_cache = {}
+
+
+def _kind_of(cls):
+    """
+    Return the batch kind for a shape class
+
+    A subclass of a registered class is batched only if it keeps the
+    registered class's area() and perimeter().
+    """
+    kind = _kind_cache.get(cls)
+    if kind is None:
+        kind = OTHER
+        for base in cls.__mro__:
+            if base in _registered:
+                if cls.area is base.area and cls.perimeter is base.perimeter:
+                    kind = _registered[base]
+                break
+        _kind_cache[cls] = kind
+    return kind
+
+
+def dimension(name):
+    """Build a property for a shape dimension; setting it drops memoized results"""
+    attr = "_" + name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        setattr(self, attr, value)
+        self._memo = {}
+
+    return property(getter, setter)
+
+
+def memoized(method):
+    """
+    Cache a no-argument shape method until one of its dimensions changes
+
+    Only shapes whose dimensions are dimension() properties are cached
+    (setting one creates the cache); on any other shape the method runs
+    every time, since nothing would tell the cache to drop a stale value.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        memo = self.__dict__.get("_memo")
+        if memo is None:
+            return method(self)
+        try:
+            return memo[name]
+        except KeyError:
+            value = memo[name] = method(self)
+            return value
+
+    return wrapper
+
+
+def _heron(a, b, c):
+    """Triangle area from its sides"""
+    s = (a + b + c) / 2
+    return math.sqrt(max(s * (s - a) * (s - b) * (s - c), 0.0))
+
+
+class ShapeBatch:
+    """
+    A struct-of-arrays store of shapes
+
+    Each group keeps its own columns, and a kind column records which
+    group each input position came from, so group results can be
+    interleaved back into input order in one pass.
+    """
+
+    def __init__(self, shapes=()):
+        """Create a batch, optionally filled from shape objects"""
+        self._kinds = array("b")
+        self._widths = array("d")
+        self._heights = array("d")
+        self._radii = array("d")
+        self._sides_a = array("d")
+        self._sides_b = array("d")
+        self._sides_c = array("d")
+        self._others = []
+        for shape in shapes:
+            self.add_shape(shape)
+
+    @staticmethod
+    def register(cls, kind):
+        """
+        Batch instances of cls as RECTANGLE, CIRCLE or TRIANGLE shapes
+
+        The class must keep its dimensions in width/height, radius or
+        a/b/c attributes to match. Returns cls.
+        """
+        if kind not in (RECTANGLE, CIRCLE, TRIANGLE):
+            raise ValueError(f"Unknown shape kind: {kind!r}")
+        _registered[cls] = kind
+        _kind_cache.clear()
+        return cls
+
+    def add_rectangle(self, width, height):
+        """Append a rectangle"""
+        self._widths.append(width)
+        self._heights.append(height)
+        self._kinds.append(RECTANGLE)
+
+    def add_circle(self, radius):
+        """Append a circle"""
+        self._radii.append(radius)
+        self._kinds.append(CIRCLE)
+
+    def add_triangle(self, a, b, c):
+        """Append a triangle"""
+        self._sides_a.append(a)
+        self._sides_b.append(b)
+        self._sides_c.append(c)
+        self._kinds.append(TRIANGLE)
+
+    def add_shape(self, shape):
+        """Append a shape object into the group for its type"""
+        kind = _kind_of(type(shape))
+        if kind == RECTANGLE:
+            self.add_rectangle(shape.width, shape.height)
+        elif kind == CIRCLE:
+            self.add_circle(shape.radius)
+        elif kind == TRIANGLE:
+            self.add_triangle(shape.a, shape.b, shape.c)
+        else:
+            self._others.append(shape)
+            self._kinds.append(OTHER)
+
+    def _triangle_columns(self, np):
+        """Return the three side columns as NumPy arrays"""
+        return (np.asarray(x) for x in (self._sides_a, self._sides_b, self._sides_c))
+
+    def _group_areas(self, np):
+        """Return {kind: areas} for each group"""
+        if np is not None:
+            w, h = np.asarray(self._widths), np.asarray(self._heights)
+            r = np.asarray(self._radii)
+            a, b, c = self._triangle_columns(np)
+            s = (a + b + c) / 2
+            heron = np.sqrt(np.maximum(s * (s - a) * (s - b) * (s - c), 0.0))
+            return {RECTANGLE: w * h, CIRCLE: math.pi * r * r, TRIANGLE: heron}
+        return {
+            RECTANGLE: map(operator.mul, self._widths, self._heights),
+            CIRCLE: map(math.pi.__mul__, map(operator.mul, self._radii, self._radii)),
+            TRIANGLE: map(_heron, self._sides_a, self._sides_b, self._sides_c),
+        }
+
+    def _group_perimeters(self, np):
+        """Return {kind: perimeters} for each group"""
+        if np is not None:
+            w, h = np.asarray(self._widths), np.asarray(self._heights)
+            r = np.asarray(self._radii)
+            a, b, c = self._triangle_columns(np)
+            perimeters = {RECTANGLE: 2 * (w + h), CIRCLE: 2 * math.pi * r}
+            perimeters[TRIANGLE] = a + b + c
+            return perimeters
+        return {
+            RECTANGLE: map(
+                (2.0).__mul__, map(operator.add, self._widths, self._heights)
+            ),
+            CIRCLE: map((2 * math.pi).__mul__, self._radii),
+            TRIANGLE: map(
+                operator.add,
+                map(operator.add, self._sides_a, self._sides_b),
+                self._sides_c,
+            ),
+        }
+
+    def _gather(self, groups, np, method):
+        """Interleave per-group results (and fallback shapes) into input order"""
+        groups[OTHER] = [getattr(shape, method)() for shape in self._others]
+        if np is not None:
+            kinds = np.frombuffer(self._kinds, dtype=np.int8)
+            values = np.empty(len(kinds))
+            for kind in _KINDS:
+                values[kinds == kind] = groups[kind]
+            result = array("d")
+            result.frombytes(values.tobytes())
+            return result
+        iterators = [iter(groups[kind]) for kind in _KINDS]
+        return array("d", map(next, map(iterators.__getitem__, self._kinds)))
+
+    def get_areas(self):
+        """Return every shape's area, in input order, as an array('d')"""
+        np = _load_numpy()
+        return self._gather(self._group_areas(np), np, "area")
+
+    def get_perimeters(self):
+        """Return every shape's perimeter, in input order, as an array('d')"""
+        np = _load_numpy()
+        return self._gather(self._group_perimeters(np), np, "perimeter")
+
+    def get_total_area(self):
+        """Return the sum of all areas"""
+        return math.fsum(self.get_areas())
+
+    def __len__(self):
+        return len(self._kinds)
+
+    def __repr__(self):
+        return (
+            f"ShapeBatch({len(self._widths)} rectangles, {len(self._radii)} circles, "
+            f"{len(self._sides_a)} triangles, {len(self._others)} other)"
+        )
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("Geometry Module Test")
+
+    class Rectangle:
+        def __init__(self, width, height):
+            self.width, self.height = width, height
+
+        def area(self):
+            return self.width * self.height
+
+        def perimeter(self):
+            return 2 * (self.width + self.height)
+
+    class Circle:
+        def __init__(self, radius):
+            self.radius = radius
+
+        def area(self):
+            return math.pi * self.radius**2
+
+        def perimeter(self):
+            return 2 * math.pi * self.radius
+
+    class Triangle:
+        def __init__(self, a, b, c):
+            self.a, self.b, self.c = a, b, c
+
+        def area(self):
+            return _heron(self.a, self.b, self.c)
+
+        def perimeter(self):
+            return self.a + self.b + self.c
+
+    ShapeBatch.register(Rectangle, RECTANGLE)
+    ShapeBatch.register(Circle, CIRCLE)
+    ShapeBatch.register(Triangle, TRIANGLE)
+
+    rng = random.Random(42)
+    makers = (
+        lambda: Rectangle(rng.uniform(1, 10), rng.uniform(1, 10)),
+        lambda: Circle(rng.uniform(1, 10)),
+        lambda: Triangle(3 * rng.uniform(1, 2), 4 * rng.uniform(1, 2), 5.5),
+    )
+    count = 1_000_000
+    shapes = [rng.choice(makers)() for _ in range(count)]
+
+    start = time.perf_counter()
+    expected_areas = [shape.area() for shape in shapes]
+    expected_perimeters = [shape.perimeter() for shape in shapes]
+    per_object = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = ShapeBatch(shapes)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    areas = batch.get_areas()
+    perimeters = batch.get_perimeters()
+    compute = time.perf_counter() - start
+
+    assert all(math.isclose(x, y) for x, y in zip(areas, expected_areas))
+    assert all(math.isclose(x, y) for x, y in zip(perimeters, expected_perimeters))
+    print(batch)
+    print(f"NumPy: {'yes' if _load_numpy() else 'no'}")
+    print(f"Per-object area()+perimeter(): {per_object:.3f} s")
+    print(f"Batch build:                   {build:.3f} s")
+    print(f"Batch areas+perimeters:        {compute:.3f} s")
+
+    # Repeated describe() calls, plain vs memoized
+    class PlainCircle(Circle):
+        def describe(self):
+            return f"Circle: Area={self.area():.2f}, Perimeter={self.perimeter():.2f}"
+
+    class CachedCircle(PlainCircle):
+        radius = dimension("radius")
+        area = memoized(PlainCircle.area)
+        perimeter = memoized(PlainCircle.perimeter)
+        describe = memoized(PlainCircle.describe)
+
+    radii = [rng.uniform(1, 10) for _ in range(100_000)]
+    for cls in (PlainCircle, CachedCircle):
+        circles = [cls(radius) for radius in radii]
+        start = time.perf_counter()
+        for _ in range(10):
+            for circle in circles:
+                circle.describe()
+        elapsed = time.perf_counter() - start
+        print(f"{cls.__name__}: 10 x describe() over 100,000 shapes: {elapsed:.3f} s")
+
+    circle = CachedCircle(1)
+    circle.describe()
+    circle.radius = 2
+    assert circle.area() == math.pi * 4, "stale memoized area"
+
+    class Square:
+        def __init__(self, side):
+            self.side = side
+
+        @memoized
+        def area(self):
+            return self.side * self.side
+
+    square = Square(2)
+    square.area()
+    square.side = 5
+    assert square.area() == 25, "shape without dimensions was memoized"
@@ -101,14 +101,12 @@ print("=" * 90)
 print()
 
 from mypackage.utils.calculator import add, subtract, percentage
-from mypackage.utils.formatter import format_date, format_file_size, format_currency
+from mypackage.utils.formatter import format_date, format_file_size
 from mypackage.models.person import Person
 from mypackage.models.product import Product
 
 print("from mypackage.utils.calculator import add, subtract, percentage")
-print(
-    "from mypackage.utils.formatter import format_date, format_file_size, format_currency"
-)
+print("from mypackage.utils.formatter import format_date, format_file_size")
 print()
 
 # Direct function calls (no module prefix needed)
@@ -210,62 +208,9 @@ print("=" * 90)
 print()
 
 
-class ShoppingCart:
-    """Shopping cart using our package"""
-
-    def __init__(self, customer):
-        self.customer = customer
-        self.items = []
-
-    def add_item(self, product, quantity=1):
-        """Add product to cart"""
-        if not product.is_in_stock():
-            return f"❌ {product.name} is out of stock!"
-
-        if quantity > product.quantity:
-            return f"❌ Only {product.quantity} units available!"
-
-        self.items.append(
-            {"product": product, "quantity": quantity, "price": product.price}
-        )
-        return f"✅ Added {quantity}x {product.name} to cart"
-
-    def get_subtotal(self):
-        """Calculate subtotal"""
-        return sum(item["price"] * item["quantity"] for item in self.items)
-
-    def get_tax(self):
-        """Calculate tax"""
-        return self.get_subtotal() * Product.tax_rate
-
-    def get_total(self):
-        """Calculate total with tax"""
-        return self.get_subtotal() + self.get_tax()
-
-    def show_cart(self):
-        """Display cart contents"""
-        print(f"🛒 Shopping Cart for {self.customer.get_full_name()}")
-        print("-" * 90)
-
-        if not self.items:
-            print("Cart is empty")
-            return
-
-        for i, item in enumerate(self.items, 1):
-            product = item["product"]
-            qty = item["quantity"]
-            price = item["price"]
-            total = price * qty
-            print(f"{i}. {product.name}")
-            print(f"   {qty} × {format_currency(price)} = {format_currency(total)}")
-
-        print("-" * 90)
-        print(f"Subtotal: {format_currency(self.get_subtotal())}")
-        print(
-            f"Tax ({percentage(Product.tax_rate * 100, 100):.0f}%): {format_currency(self.get_tax())}"
-        )
-        print(f"TOTAL: {format_currency(self.get_total())}")
-
+# ShoppingCart lives in the package so other programs can reuse it:
+# one line per product, running totals, and batched checkout_carts()
+from mypackage.models.cart import ShoppingCart, checkout_carts
 
 # Create customer
 customer = Person("Sarah", "Wilson", 32, "sarah@example.com")
@@ -286,10 +231,22 @@ print(cart.add_item(products[1], 3))  # 3 cables
 print(cart.add_item(products[2], 1))  # 1 bag
 print()
 
+# Adding the same product again merges into its existing line
+print(cart.add_item(products[0], 1))  # 1 more mouse
+print()
+
 # Show cart
 cart.show_cart()
 print()
 
+# Check out several carts in one batch
+other_cart = ShoppingCart(Person("Tom", "Baker", 41))
+print(other_cart.add_item(products[2], 2))
+completed, rejected = checkout_carts([cart, other_cart])
+print(f"💳 Batch checkout: {len(completed)} completed, {len(rejected)} rejected")
+print(f"Stock left: {products[0]}, {products[2]}")
+print()
+
 # ============================================================================
 # SUMMARY
 # ============================================================================
@@ -0,0 +1,240 @@
+"""
+Prime Numbers Module
+Fast primality tests and prime generation
+
+Small numbers are answered from a sieve of Eratosthenes cache that grows
+on demand, one segment at a time. Numbers above the cache limit use a
+deterministic Miller-Rabin test, which is exact for every n below
+3.3 * 10**24 (so for all 64-bit integers).
+"""
+
+import random
+import threading
+import time
+from math import isqrt
+
+# Miller-Rabin with these bases is exact for n < 3,317,044,064,679,887,385,961,981
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+DEFAULT_MAX_CACHED = 10_000_000
+SEGMENT_SIZE = 1 << 18
+
+
+def is_prime_trial(n):
+    """Check if a number is prime by trial division (the original is_prime)"""
+    if n < 2:
+        return False
+    for i in range(2, int(n**0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def miller_rabin(n):
+    """Deterministic Miller-Rabin primality test for n < 3.3 * 10**24"""
+    if n < 2:
+        return False
+    for p in MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _sieve_segment(lo, hi, base_primes):
+    """
+    Sieve the odd numbers in [lo, hi) using odd base primes
+
+    lo must be even. Returns a bytearray where index j is 1 if the odd
+    number lo + 1 + 2j is prime.
+    """
+    count = (hi - lo) // 2
+    flags = bytearray(b"\x01") * count
+    for p in base_primes:
+        if p * p >= hi:
+            break
+        start = max(p * p, -(-(lo + 1) // p) * p)
+        if start % 2 == 0:
+            start += p
+        first = (start - lo - 1) // 2
+        if first < count:
+            flags[first::p] = bytes(len(range(first, count, p)))
+    if lo == 0 and count:
+        flags[0] = 0  # 1 is not prime
+    return flags
+
+
+def _simple_odd_primes(limit):
+    """Return the odd primes below limit with a plain sieve (for bootstrapping)"""
+    flags = _sieve_segment(0, limit + limit % 2, range(3, isqrt(limit) + 1, 2))
+    return [2 * i + 1 for i, flag in enumerate(flags) if flag]
+
+
+class PrimeSieve:
+    """
+    A growing cache of primality flags
+
+    Flags are stored one byte per odd number in a bytearray and are
+    extended (at least doubling) whenever a lookup goes past the end,
+    up to max_cached. Extending is serialized by a lock, so one sieve can
+    be shared between threads.
+    """
+
+    def __init__(self, max_cached=DEFAULT_MAX_CACHED):
+        """Create a sieve caching primes below max_cached"""
+        self.max_cached = max_cached
+        self._flags = bytearray()  # index i -> is 2i + 1 prime
+        self._limit = 0  # every number below this is covered
+        self._lock = threading.Lock()
+        self._extend(1024)
+
+    def get_limit(self):
+        """Return the number below which primality is cached"""
+        return self._limit
+
+    def _odd_primes_below(self, limit):
+        """Yield cached odd primes below limit"""
+        flags = self._flags
+        end = min(limit, self._limit) // 2
+        i = flags.find(1, 1)
+        while 0 <= i < end:
+            yield 2 * i + 1
+            i = flags.find(1, i + 1)
+
+    def _extend(self, limit):
+        """Grow the cache so every number below limit is covered"""
+        if limit <= self._limit:
+            return
+        with self._lock:
+            # Another thread may have extended while this one waited
+            if limit <= self._limit:
+                return
+            target = max(limit, min(2 * self._limit, self.max_cached))
+            target += target % 2
+            root = isqrt(target) + 1
+            if root <= self._limit:
+                base_primes = list(self._odd_primes_below(root))
+            else:
+                base_primes = _simple_odd_primes(root)
+
+            lo = self._limit
+            while lo < target:
+                hi = min(lo + SEGMENT_SIZE, target)
+                self._flags += _sieve_segment(lo, hi, base_primes)
+                lo = hi
+            # Publish the new limit only once its flags are in place
+            self._limit = target
+
+    def is_prime(self, n):
+        """Check if an integer is prime"""
+        if n < 2:
+            return False
+        if n % 2 == 0:
+            return n == 2
+        if n >= self._limit:
+            if n >= self.max_cached:
+                return miller_rabin(n)
+            self._extend(n + 1)
+        return self._flags[n // 2] == 1
+
+    def primes_in_range(self, start, stop):
+        """Yield the primes p with start <= p < stop, in increasing order"""
+        if start <= 2 < stop:
+            yield 2
+        start = max(start, 3)
+
+        cached_stop = min(stop, self.max_cached)
+        if start < cached_stop:
+            self._extend(cached_stop)
+            flags = self._flags
+            end = cached_stop // 2
+            i = flags.find(1, start // 2, end)
+            while i != -1:
+                yield 2 * i + 1
+                i = flags.find(1, i + 1, end)
+            start = cached_stop
+
+        if start >= stop:
+            return
+        root = isqrt(stop - 1) + 1
+        if root > self.max_cached:
+            # Too far out to sieve from the cache: test odd numbers one by one
+            for n in range(start | 1, stop, 2):
+                if miller_rabin(n):
+                    yield n
+            return
+
+        # Sieve the rest segment by segment without caching it
+        self._extend(root)
+        base_primes = list(self._odd_primes_below(root))
+        lo = start - start % 2
+        while lo < stop:
+            hi = min(lo + SEGMENT_SIZE, stop + stop % 2)
+            flags = _sieve_segment(lo, hi, base_primes)
+            j = flags.find(1)
+            while j != -1:
+                n = lo + 1 + 2 * j
+                if n >= stop:
+                    return
+                if n >= start:
+                    yield n
+                j = flags.find(1, j + 1)
+            lo = hi
+
+
+_default_sieve = PrimeSieve()
+
+
+def is_prime(n):
+    """Check if an integer is prime using the shared sieve cache"""
+    return _default_sieve.is_prime(n)
+
+
+def primes_in_range(start, stop):
+    """Yield the primes p with start <= p < stop using the shared sieve cache"""
+    return _default_sieve.primes_in_range(start, stop)
+
+
+# Module metadata
+__version__ = "1.0.0"
+__author__ = "Python Series"
+
+
+# Benchmark (runs only when module is executed directly)
+if __name__ == "__main__":
+    print("🔢 Primes Module - Benchmark")
+
+    def timed(label, func, numbers):
+        start = time.perf_counter()
+        found = sum(1 for n in numbers if func(n))
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<22} {elapsed * 1000:>10.1f} ms  ({found} primes)")
+        return found
+
+    cases = [("n < 10**6", 10**6, 20_000), ("n < 10**12", 10**12, 2_000)]
+    for label, upper, size in cases:
+        numbers = [random.randrange(upper) for _ in range(size)]
+        print(f"{size:,} random {label}:")
+        expected = timed("trial division", is_prime_trial, numbers)
+        assert timed("sieve / Miller-Rabin", PrimeSieve().is_prime, numbers) == expected
+
+    start = time.perf_counter()
+    count = sum(1 for _ in primes_in_range(0, 10**7))
+    elapsed = time.perf_counter() - start
+    print(f"primes_in_range(0, 10**7): {count} primes in {elapsed * 1000:.1f} ms")
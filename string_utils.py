@@ -3,6 +3,24 @@ String Utilities Module
 Provides string manipulation functions
 """
 
+import mmap
+import time
+import timeit
+from collections import Counter
+from itertools import islice
+
+VOWELS = "aeiouAEIOU"
+
+# Precomputed str.translate tables
+_DELETE_VOWELS = str.maketrans("", "", VOWELS)
+_DELETE_SPACES = str.maketrans("", "", " ")
+
+# Below this length str.replace beats str.translate for removing spaces
+TRANSLATE_MIN_LENGTH = 2048
+
+# Block size for palindrome checks and reverse iteration over large inputs
+PALINDROME_CHUNK_SIZE = 1 << 16
+
 
 def reverse(text):
     """Reverse a string"""
@@ -11,8 +29,7 @@ def reverse(text):
 
 def count_vowels(text):
     """Count vowels in a string"""
-    vowels = "aeiouAEIOU"
-    return sum(1 for char in text if char in vowels)
+    return len(text) - len(text.translate(_DELETE_VOWELS))
 
 
 def capitalize_words(text):
@@ -20,10 +37,77 @@ def capitalize_words(text):
     return text.title()
 
 
-def is_palindrome(text):
-    """Check if text is a palindrome (reads same forwards and backwards)"""
-    clean_text = text.lower().replace(" ", "")
-    return clean_text == clean_text[::-1]
+def _as_sequence(data):
+    """Return str/bytes/bytearray/mmap as is, anything else as a byte memoryview"""
+    if isinstance(data, (str, bytes, bytearray, mmap.mmap)):
+        return data
+    view = memoryview(data)
+    return view if view.format == "B" else view.cast("B")
+
+
+def _read(data, start, stop):
+    """Copy out data[start:stop] as str or bytes"""
+    chunk = data[start:stop]
+    return chunk.tobytes() if isinstance(chunk, memoryview) else chunk
+
+
+def iter_reversed(data, chunk_size=PALINDROME_CHUNK_SIZE):
+    """Yield text, bytes, a memoryview or an mmap back to front in reversed chunks"""
+    data = _as_sequence(data)
+    end = len(data)
+    while end > 0:
+        start = max(0, end - chunk_size)
+        yield _read(data, start, end)[::-1]
+        end = start
+
+
+def is_palindrome(text, chunk_size=PALINDROME_CHUNK_SIZE):
+    """
+    Check if text is a palindrome (reads same forwards and backwards)
+
+    Case and spaces are ignored. Accepts str, bytes, bytearray,
+    memoryview or mmap. Inputs longer than chunk_size are compared from
+    both ends a block at a time, so at most a few blocks are copied
+    no matter how large the input is.
+    """
+    data = _as_sequence(text)
+    space = " " if isinstance(data, str) else b" "
+    empty = space[:0]
+
+    if len(data) <= chunk_size:
+        clean_text = _read(data, 0, len(data)).lower().replace(space, empty)
+        return clean_text == clean_text[::-1]
+
+    # front holds cleaned characters read from the start that are not yet
+    # matched, back the same from the end (in reversed order)
+    front = back = empty
+    i, j = 0, len(data)
+    while i < j:
+        step = min(chunk_size, (j - i + 1) // 2)
+        front += _read(data, i, i + step).lower().replace(space, empty)
+        i += step
+        step = min(chunk_size, j - i)
+        back += _read(data, j - step, j).lower().replace(space, empty)[::-1]
+        j -= step
+
+        matched = min(len(front), len(back))
+        if front[:matched] != back[:matched]:
+            return False
+        front = front[matched:]
+        back = back[matched:]
+
+    # Whatever is left unmatched is the middle, which must mirror itself
+    middle = front or back
+    return middle == middle[::-1]
+
+
+def is_palindrome_file(path, chunk_size=PALINDROME_CHUNK_SIZE):
+    """Check if a file's bytes form a palindrome, via a read-only mmap"""
+    with open(path, "rb") as file:
+        if not file.seek(0, 2):
+            return True  # an empty file can't be mmapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return is_palindrome(data, chunk_size)
 
 
 def count_words(text):
@@ -33,6 +117,8 @@ def count_words(text):
 
 def remove_spaces(text):
     """Remove all spaces from text"""
+    if len(text) >= TRANSLATE_MIN_LENGTH:
+        return text.translate(_DELETE_SPACES)
     return text.replace(" ", "")
 
 
@@ -46,7 +132,7 @@ def to_camel_case(text):
     words = text.split()
     if not words:
         return ""
-    return words[0].lower() + "".join(word.capitalize() for word in words[1:])
+    return words[0].lower() + "".join(map(str.capitalize, islice(words, 1, None)))
 
 
 def truncate(text, length=10, suffix="..."):
@@ -61,6 +147,159 @@ def count_characters(text, char):
     return text.count(char)
 
 
+def transform_many(transform, texts):
+    """Apply a transform (e.g. to_snake_case) to each string in an iterable, lazily"""
+    return map(transform, texts)
+
+
+class TextStats:
+    """
+    Analyze text in a single pass, chunk by chunk
+
+    Each chunk fed in is read once to update the word count and the
+    per-character counts (which also give the length and vowel count).
+    With keep_transforms=True the reversed, capitalized and snake_case
+    forms are built along the way as well. Chunks may split words
+    anywhere, so a large file can be streamed line by line or in blocks.
+    """
+
+    def __init__(self, keep_transforms=False):
+        """Create an empty analyzer"""
+        self.keep_transforms = keep_transforms
+        self.char_count = 0
+        self.word_count = 0
+        self.character_counts = Counter()
+        self._last_char = ""
+        self._mid_word = False  # last char is cased, as str.title() sees it
+        self._reversed_chunks = []
+        self._capitalized_chunks = []
+        self._snake_chunks = []
+
+    @classmethod
+    def from_text(cls, text, keep_transforms=True):
+        """Analyze a whole string"""
+        stats = cls(keep_transforms)
+        stats.feed(text)
+        return stats
+
+    @classmethod
+    def from_file(cls, path, encoding="utf-8", keep_transforms=False):
+        """Analyze a text file line by line"""
+        stats = cls(keep_transforms)
+        with open(path, encoding=encoding) as file:
+            for line in file:
+                stats.feed(line)
+        return stats
+
+    def feed(self, chunk):
+        """Add the next chunk of text"""
+        if not chunk:
+            return
+        words = len(chunk.split())
+        # A word split across two chunks was counted once in each
+        if words and self._last_char and not self._last_char.isspace():
+            if not chunk[0].isspace():
+                words -= 1
+        self.word_count += words
+        self.char_count += len(chunk)
+        self.character_counts.update(chunk)
+
+        if self.keep_transforms:
+            self._reversed_chunks.append(chunk[::-1])
+            # title() capitalizes a letter unless the character before it is
+            # cased; after a cased character, a stand-in "a" (which title()
+            # keeps one character long) makes it continue the word instead
+            if self._mid_word:
+                capitalized = ("a" + chunk).title()[1:]
+            else:
+                capitalized = chunk.title()
+            self._capitalized_chunks.append(capitalized)
+            self._snake_chunks.append(chunk.lower().replace(" ", "_"))
+        last = self._last_char = chunk[-1]
+        self._mid_word = last.islower() or last.isupper() or last.istitle()
+
+    def get_vowel_count(self):
+        """Return the number of vowels seen"""
+        counts = self.character_counts
+        return sum(counts[vowel] for vowel in VOWELS)
+
+    def count_characters(self, char):
+        """Return how many times a single character was seen"""
+        return self.character_counts[char]
+
+    def _transformed(self, chunks):
+        """Join transformed chunks, if they were kept"""
+        if not self.keep_transforms:
+            raise ValueError("Transforms are only kept with keep_transforms=True")
+        return "".join(chunks)
+
+    def get_reversed(self):
+        """Return the whole text reversed"""
+        return self._transformed(reversed(self._reversed_chunks))
+
+    def get_capitalized(self):
+        """Return the whole text with each word capitalized"""
+        return self._transformed(self._capitalized_chunks)
+
+    def get_snake_case(self):
+        """Return the whole text in snake_case"""
+        return self._transformed(self._snake_chunks)
+
+    def __repr__(self):
+        """Developer representation"""
+        return (
+            f"TextStats(chars={self.char_count}, words={self.word_count}, "
+            f"vowels={self.get_vowel_count()})"
+        )
+
+
+def measure_throughput(text, chunk_size=None):
+    """Return MB/s for TextStats over text, fed per line or per chunk_size chars"""
+    if chunk_size:
+        chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+    else:
+        chunks = text.splitlines(keepends=True)
+    start = time.perf_counter()
+    stats = TextStats()
+    for chunk in chunks:
+        stats.feed(chunk)
+    elapsed = time.perf_counter() - start
+    return len(text.encode()) / elapsed / 1_000_000
+
+
+def run_microbenchmarks():
+    """Print per-call cost of the transforms on short and 1 MB inputs"""
+    reference = {
+        "count_vowels": lambda text: sum(1 for char in text if char in VOWELS),
+        "remove_spaces": lambda text: text.replace(" ", ""),
+        "to_snake_case": lambda text: text.lower().replace(" ", "_"),
+        "to_camel_case": lambda text: text.split()[0].lower()
+        + "".join(word.capitalize() for word in text.split()[1:]),
+    }
+    current = {
+        "count_vowels": count_vowels,
+        "remove_spaces": remove_spaces,
+        "to_snake_case": to_snake_case,
+        "to_camel_case": to_camel_case,
+    }
+    sentence = "The quick brown fox jumps over the lazy dog "
+    inputs = [
+        ("short", sentence, 100_000),
+        ("1 MB", sentence * (1_000_000 // len(sentence)), 10),
+    ]
+
+    print(f"{'function':<16}{'input':>8}{'before (us)':>14}{'after (us)':>14}")
+    for name, func in current.items():
+        for label, text, number in inputs:
+            assert func(text) == reference[name](text)
+            before = timeit.timeit(lambda: reference[name](text), number=number)
+            after = timeit.timeit(lambda: func(text), number=number)
+            print(
+                f"{name:<16}{label:>8}"
+                f"{before / number * 1e6:>14.2f}{after / number * 1e6:>14.2f}"
+            )
+
+
 # Module metadata
 __version__ = "1.0.0"
 __author__ = "Python Series"
@@ -73,6 +312,7 @@ if __name__ == "__main__":
     print(f"count_vowels('Hello World') = {count_vowels('Hello World')}")
     print(f"capitalize_words('hello world') = {capitalize_words('hello world')}")
     print(f"is_palindrome('racecar') = {is_palindrome('racecar')}")
+    print(f"is_palindrome(b'Taco cat') = {is_palindrome(b'Taco cat')}")
     print(f"count_words('This is a test') = {count_words('This is a test')}")
     print(f"remove_spaces('Hello World') = {remove_spaces('Hello World')}")
     print(f"to_snake_case('Hello World') = {to_snake_case('Hello World')}")
@@ -81,3 +321,10 @@ if __name__ == "__main__":
     print(
         f"count_characters('Mississippi', 's') = {count_characters('Mississippi', 's')}"
     )
+    print(f"TextStats.from_text('Hello World') = {TextStats.from_text('Hello World')}")
+
+    sample = "The quick brown fox jumps over the lazy dog\n" * 250_000
+    print(f"TextStats per line: {measure_throughput(sample):.1f} MB/s")
+    print(f"TextStats per 64 KiB: {measure_throughput(sample, 65536):.1f} MB/s")
+    print()
+    run_microbenchmarks()